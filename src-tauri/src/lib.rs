@@ -1,15 +1,19 @@
 use serde::{Deserialize, Serialize};
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
+use std::collections::hash_map::DefaultHasher;
+use std::hash::{Hash, Hasher};
 use std::fs;
-use std::io::Read;
+use std::io::{BufRead, Read};
 use std::net::TcpStream;
-use std::path::PathBuf;
+use std::path::{Path, PathBuf};
 use std::time::Duration;
 use ssh2::Session;
 use tauri::{AppHandle, Emitter, Manager, WebviewUrl, WebviewWindowBuilder};
 use tauri::tray::{TrayIconBuilder};
-use chrono::{DateTime, Utc};
+use chrono::{DateTime, FixedOffset, NaiveDate, NaiveDateTime, Offset, Utc};
 use std::sync::Arc;
+use once_cell::sync::Lazy;
+use quick_xml::events::Event;
 
 #[cfg(windows)]
 use std::os::windows::process::CommandExt;
@@ -25,6 +29,17 @@ struct ServerConfig {
     use_slurm: Option<bool>,
 }
 
+impl ServerConfig {
+    // "host:port"; doubles as the worker key and the TCP connect address
+    fn addr(&self) -> String {
+        format!("{}:{}", self.host, self.port.unwrap_or(22))
+    }
+
+    fn user_name(&self) -> &str {
+        self.user.as_deref().unwrap_or("root")
+    }
+}
+
 #[derive(Debug, Serialize, Deserialize, Default, Clone)]
 struct GpuConfig {
     servers: Vec<ServerConfig>,
@@ -98,9 +113,9 @@ struct WidgetThemeConfig {
 #[derive(Debug, Serialize, Deserialize, Clone)]
 pub struct GpuInfo {
     name: String,
-    mem_used: f32,
-    mem_total: f32,
-    util: f32,
+    mem_used: u32, // MiB
+    mem_total: u32, // MiB
+    util: u32, // %
     temp: Option<f32>,
     power: Option<f32>,
     job_id: Option<String>,
@@ -116,7 +131,7 @@ pub struct ServerGpuData {
     pub last_update: Option<String>,
 }
 
-#[derive(Debug, Serialize, Deserialize, Clone)]
+#[derive(Debug, Serialize, Deserialize, Clone, PartialEq)]
 pub struct PaperDeadlineInfo {
     title: String,
     year: String,
@@ -156,13 +171,34 @@ struct YamlConfItem {
     confs: Option<Vec<YamlConfYear>>,
 }
 
+// A conference's deadlines, parsed once per fetch so refiltering never touches the YAML again
+struct ConfDeadlines {
+    title: String,
+    rank: String,
+    rank_bit: u8,
+    sub: String,
+    deadlines: Vec<ConfDeadline>,
+}
+
+struct ConfDeadline {
+    year: String,
+    timezone: String,
+    place: String,
+    link: String,
+    at: i64, // Unix seconds; compared as a plain integer when filtering
+}
+
 struct GlobalState {
     deadlines: Arc<std::sync::Mutex<Vec<PaperDeadlineInfo>>>,
     gpu_data: Arc<std::sync::Mutex<HashMap<String, ServerGpuData>>>,
-    last_yaml: Arc<std::sync::Mutex<Option<String>>>,
+    gpu_emitted: Arc<std::sync::Mutex<HashMap<String, (u64, std::time::Instant)>>>,
+    conferences: Arc<std::sync::Mutex<Option<Arc<Vec<ConfDeadlines>>>>>,
     active_monitors: Arc<std::sync::Mutex<HashMap<String, tokio::task::JoinHandle<()>>>>,
     active_workers: Arc<std::sync::Mutex<HashMap<String, tokio::task::JoinHandle<()>>>>,
     arxiv_papers: Arc<std::sync::Mutex<Vec<ArxivPaper>>>,
+    gpu_config_changed: Arc<tokio::sync::Notify>,
+    arxiv_config_changed: Arc<tokio::sync::Notify>,
+    paper_config_changed: Arc<tokio::sync::Notify>,
 }
 
 // Helper to find/initialize config file
@@ -209,51 +245,185 @@ fn get_config_path(app: &AppHandle, filename: &str) -> PathBuf {
     path
 }
 
-fn parse_nvidia_smi_output(output: &str) -> Vec<GpuInfo> {
-    let mut list = Vec::new();
-    for line in output.lines() {
-        let mut node_id = None;
-        let mut content = line;
-
-        // Handle Slurm --label output: "0: name, used, ..."
-        if line.contains(": ") {
-            let parts: Vec<&str> = line.splitn(2, ": ").collect();
-            if parts.len() == 2 && parts[0].chars().all(|c| c.is_numeric()) {
-                node_id = Some(parts[0].trim().to_string());
-                content = parts[1];
+// Parsed config files keyed by path; an entry is reused while the file's mtime and size are unchanged
+static CONFIG_CACHE: Lazy<std::sync::Mutex<HashMap<PathBuf, (std::time::SystemTime, u64, Arc<serde_json::Value>)>>> =
+    Lazy::new(Default::default);
+
+fn load_config<T: serde::de::DeserializeOwned>(path: &Path) -> Option<T> {
+    let meta = fs::metadata(path).ok()?;
+    let (mtime, len) = (meta.modified().ok()?, meta.len());
+    let cached = CONFIG_CACHE.lock().ok().and_then(|cache| {
+        cache.get(path).filter(|(t, l, _)| *t == mtime && *l == len).map(|(_, _, v)| v.clone())
+    });
+    let value = match cached {
+        Some(v) => v,
+        None => {
+            let v: Arc<serde_json::Value> = Arc::new(serde_json::from_str(&fs::read_to_string(path).ok()?).ok()?);
+            if let Ok(mut cache) = CONFIG_CACHE.lock() {
+                cache.insert(path.to_path_buf(), (mtime, len, v.clone()));
             }
+            v
         }
+    };
+    T::deserialize(&*value).ok()
+}
 
-        let parts: Vec<&str> = content.split(',').collect();
-        if parts.len() >= 6 {
-            list.push(GpuInfo {
-                node: node_id,
-                name: parts[0].trim().to_string(),
-                mem_used: parts[1].trim().parse().unwrap_or(0.0),
-                mem_total: parts[2].trim().parse().unwrap_or(0.0),
-                util: parts[3].trim().parse().unwrap_or(0.0),
-                temp: parts[4].trim().parse().ok(),
-                power: parts[5].trim().parse().ok(),
-                job_id: None,
-            });
+// Skips the write (and the mtime bump that invalidates readers) when nothing changed.
+// Returns whether the file was written, so callers can skip the follow-up work too.
+fn write_config(path: &Path, content: &str) -> Result<bool, String> {
+    if fs::read(path).map(|cur| cur == content.as_bytes()).unwrap_or(false) {
+        return Ok(false);
+    }
+    // Write a sibling and rename it over the original, so a crash mid-write leaves the
+    // previous config intact instead of a truncated file that no longer parses
+    let mut tmp = path.as_os_str().to_owned();
+    tmp.push(".tmp");
+    fs::write(&tmp, content).and_then(|_| fs::rename(&tmp, path)).map_err(|e| e.to_string())?;
+    Ok(true)
+}
+
+fn gpu_enabled(app: &AppHandle) -> bool {
+    load_config::<AppConfig>(&get_config_path(app, "app_config.json"))
+        .and_then(|c| c.gpu_enabled)
+        .unwrap_or(true)
+}
+
+// Sampling interval in seconds from the (cached) config; None when it can't be read
+fn gpu_update_interval(app: &AppHandle) -> Option<u64> {
+    load_config::<GpuConfig>(&get_config_path(app, "gpu_monitor.json")).map(|c| c.update_interval.unwrap_or(5))
+}
+
+// `index` comes first so a `-lms` stream can be split into samples without a sentinel line
+const SMI_QUERY: &str = "--query-gpu=index,name,memory.used,memory.total,utilization.gpu,temperature.gpu,power.draw";
+const SMI_FORMAT: &str = "--format=csv,noheader,nounits";
+
+// Separates the squeue and nvidia-smi sections when both run in one exec
+const SMI_SECTION_MARK: &str = "__WIDGITRON_SMI__";
+
+// One-shot query, or a long-lived sampler when `loop_ms` is set (avoids re-initialising the driver per poll)
+fn smi_command(loop_ms: Option<u64>) -> String {
+    match loop_ms {
+        Some(ms) => format!("nvidia-smi {} {} -lms {}", SMI_QUERY, SMI_FORMAT, ms),
+        None => format!("nvidia-smi {} {}", SMI_QUERY, SMI_FORMAT),
+    }
+}
+
+// Parses one CSV row, returning the GPU index alongside the reading
+fn parse_smi_line(line: &str) -> Option<(u32, GpuInfo)> {
+    let mut node_id = None;
+    let mut content = line;
+
+    // Handle Slurm --label output: "0: index, name, used, ..."
+    if let Some((label, rest)) = line.split_once(": ") {
+        let label = label.trim();
+        if !label.is_empty() && label.chars().all(|c| c.is_numeric()) {
+            node_id = Some(label.to_string());
+            content = rest;
         }
     }
-    list
+
+    // Walk the fields in place
+    let mut f = content.split(',').map(str::trim);
+    let (index, name, used, total, util, temp, power) =
+        (f.next()?, f.next()?, f.next()?, f.next()?, f.next()?, f.next()?, f.next()?);
+    Some((index.parse().ok()?, GpuInfo {
+        node: node_id,
+        name: name.to_string(),
+        mem_used: used.parse().unwrap_or(0),
+        mem_total: total.parse().unwrap_or(0),
+        util: util.parse().unwrap_or(0),
+        temp: temp.parse().ok(),
+        power: power.parse().ok(),
+        job_id: None,
+    }))
+}
+
+fn parse_nvidia_smi_output(output: &str) -> Vec<GpuInfo> {
+    output.lines().filter_map(parse_smi_line).map(|(_, gpu)| gpu).collect()
+}
+
+// Splits a `nvidia-smi -lms` stream into samples, per Slurm task. The GPU count of a
+// task is (re)learned whenever its index wraps back to 0 with rows pending; with a
+// count known, a sample is flushed as soon as its last row arrives. A row out of
+// sequence drops the partial sample and the count, so the stream resyncs on the next
+// wrap whether the GPU set shrank, grew or a row went missing.
+#[derive(Default)]
+struct SmiStreamBatcher {
+    pending: HashMap<Option<String>, Vec<GpuInfo>>,
+    gpu_count: HashMap<Option<String>, usize>,
+}
+
+impl SmiStreamBatcher {
+    fn push(&mut self, line: &str) -> Option<Vec<GpuInfo>> {
+        let (index, gpu) = parse_smi_line(line)?;
+        let task = gpu.node.clone();
+        let pending = self.pending.entry(task.clone()).or_default();
+        if index == 0 {
+            if !pending.is_empty() {
+                // Wrapped before reaching the expected count (first sample, or the GPU set changed)
+                self.gpu_count.insert(task.clone(), pending.len());
+                pending.clear();
+            }
+        } else if index as usize != pending.len() {
+            pending.clear();
+            self.gpu_count.remove(&task);
+            return None;
+        }
+        pending.push(gpu);
+        if self.gpu_count.get(&task) == Some(&pending.len()) {
+            return Some(std::mem::take(pending));
+        }
+        None
+    }
 }
 
 // --- GPU Polling Task (Persistent Workers) ---
 
+// Idle GPUs repeat the same sample every tick; only re-send it this often so "Last:" stays fresh
+const GPU_HEARTBEAT: Duration = Duration::from_secs(10);
+
+// Fingerprint of everything the UI renders except the timestamp; cheaper to keep and
+// compare per host than a cloned copy of the last payload
+fn gpu_signature(data: &ServerGpuData) -> u64 {
+    let mut h = DefaultHasher::new();
+    data.is_online.hash(&mut h);
+    data.error.hash(&mut h);
+    for g in &data.gpu_list {
+        (&g.name, g.mem_used, g.mem_total, g.util, &g.job_id, &g.node).hash(&mut h);
+        g.temp.map(f32::to_bits).hash(&mut h);
+        g.power.map(f32::to_bits).hash(&mut h);
+    }
+    h.finish()
+}
+
+// Returns whether the data differed from the last snapshot sent for the host
+fn emit_gpu_update(app: &AppHandle, state: &GlobalState, data: &ServerGpuData) -> bool {
+    let sig = gpu_signature(data);
+    let mut changed = true;
+    if let Ok(mut emitted) = state.gpu_emitted.lock() {
+        if let Some((last, at)) = emitted.get(&data.host) {
+            changed = *last != sig;
+            if !changed && at.elapsed() < GPU_HEARTBEAT { return false; }
+        }
+        emitted.insert(data.host.clone(), (sig, std::time::Instant::now()));
+    }
+    let _ = app.emit("gpu_update", data);
+    changed
+}
+
+// Fallback key for servers without a key_file or password; the path only needs expanding once
+static DEFAULT_KEY: Lazy<PathBuf> = Lazy::new(|| PathBuf::from(shellexpand::tilde("~/.ssh/id_rsa").as_ref()));
+
 fn ssh_authenticate(sess: &mut Session, s: &ServerConfig) -> Result<(), String> {
-    let user = s.user.as_deref().unwrap_or("root");
+    let user = s.user_name();
     if let Some(key_path) = &s.key_file {
         let expanded = shellexpand::tilde(key_path).to_string();
         sess.userauth_pubkey_file(user, None, std::path::Path::new(&expanded), None).map_err(|e| format!("Key auth failed: {}", e))?;
     } else if let Some(pass) = &s.password {
         sess.userauth_password(user, pass).map_err(|e| format!("Password auth failed: {}", e))?;
     } else {
-        let default_key = shellexpand::tilde("~/.ssh/id_rsa").to_string();
-        if std::path::Path::new(&default_key).exists() {
-            sess.userauth_pubkey_file(user, None, std::path::Path::new(&default_key), None).map_err(|e| format!("Default key auth failed: {}", e))?;
+        if DEFAULT_KEY.exists() {
+            sess.userauth_pubkey_file(user, None, &DEFAULT_KEY, None).map_err(|e| format!("Default key auth failed: {}", e))?;
         } else {
             let _ = sess.userauth_agent(user);
         }
@@ -261,31 +431,85 @@ fn ssh_authenticate(sess: &mut Session, s: &ServerConfig) -> Result<(), String>
     Ok(())
 }
 
+// Upper bound for a one-shot remote command (squeue / fallback nvidia-smi)
+const EXEC_TIMEOUT: Duration = Duration::from_secs(10);
+const SESSION_TIMEOUT_MS: u32 = 30000;
+
+// Runs `cmd` on a fresh channel and reads its output against a deadline, so a hung
+// remote command costs at most EXEC_TIMEOUT instead of stalling the worker on a
+// blocking read_to_string. Returns None on failure or timeout.
+fn exec_bounded(sess: &Session, cmd: &str) -> Option<String> {
+    let mut channel = sess.channel_session().ok()?;
+    channel.exec(cmd).ok()?;
+    let deadline = std::time::Instant::now() + EXEC_TIMEOUT;
+    let mut out = Vec::new();
+    let mut chunk = [0u8; 4096];
+    let res = loop {
+        let remaining = deadline.saturating_duration_since(std::time::Instant::now());
+        if remaining.is_zero() { break None; }
+        // Each blocking read may only wait for what is left of the deadline
+        sess.set_timeout(remaining.as_millis().max(1) as u32);
+        match channel.read(&mut chunk) {
+            Ok(0) => break Some(()),
+            Ok(n) => out.extend_from_slice(&chunk[..n]),
+            Err(_) => break None,
+        }
+    };
+    sess.set_timeout(SESSION_TIMEOUT_MS);
+    res.map(|_| String::from_utf8_lossy(&out).into_owned())
+}
+
+// True when the dashboard or a GPU widget is on screen; the supervisor skips polls otherwise
+fn gpu_view_visible(app: &AppHandle) -> bool {
+    app.webview_windows().iter().any(|(label, win)| {
+        (label == "main" || label.starts_with("widget-gpu")) && win.is_visible().unwrap_or(false)
+    })
+}
+
+fn is_local_host(host: &str) -> bool {
+    matches!(host, "localhost" | "127.0.0.1" | "::1")
+}
+
+// Retry delay after consecutive failures: 10s, 20s, 40s ... capped at an hour, so a
+// misconfigured or unreachable server stops costing a connection attempt every few seconds
+fn backoff_delay(failures: u32) -> Duration {
+    Duration::from_secs((10u64 << failures.min(9)).min(3600))
+}
+
 fn start_ssh_monitor_task(
     app: AppHandle,
     state: Arc<GlobalState>,
-    server: ServerConfig,
+    server: Arc<ServerConfig>,
+    monitor_key: String,
     jid: Option<String>,
     node_count: Option<String>,
     interval: u64,
 ) -> tokio::task::JoinHandle<()> {
     tokio::spawn(async move {
-        let smi_cmd = "nvidia-smi --query-gpu=name,memory.used,memory.total,utilization.gpu,temperature.gpu,power.draw --format=csv,noheader,nounits";
+        let smi_cmd = smi_command(Some(interval * 1000));
+        let mut failures = 0;
         loop {
             let app_inner = app.clone();
             let state_inner = state.clone();
             let s_m = server.clone();
             let j_m = jid.clone();
             let n_m = node_count.clone();
+            let smi_m = smi_cmd.clone();
+            let key_m = monitor_key.clone();
             
-            let res = tokio::task::spawn_blocking(move || -> Option<()> {
-                let host_id = format!("{}:{}", s_m.host, s_m.port.unwrap_or(22));
+            // Some(true): monitoring was switched off or this sampler unregistered;
+            // Some(false): a working stream ended; None: connecting or sampling failed
+            let res = tokio::task::spawn_blocking(move || -> Option<bool> {
+                // Rows arrive once per -lms period, so reads may sit idle that long; allow
+                // the period plus the usual margin before calling the stream dead
+                let stream_timeout = Duration::from_secs(interval) + Duration::from_millis(SESSION_TIMEOUT_MS as u64);
+
                 // Use a standard connect but set a read timeout immediately to avoid forever hangs
-                let tcp = TcpStream::connect(&host_id).ok()?;
-                let _ = tcp.set_read_timeout(Some(Duration::from_secs(60)));
+                let tcp = TcpStream::connect(s_m.addr()).ok()?;
+                let _ = tcp.set_read_timeout(Some(stream_timeout.max(Duration::from_secs(60))));
                 
                 let mut sess = Session::new().ok()?;
-                sess.set_timeout(30000); // 30s timeout for SSH operations
+                sess.set_timeout(SESSION_TIMEOUT_MS); // 30s timeout for SSH operations
                 sess.set_tcp_stream(tcp);
                 sess.handshake().ok()?;
                 
@@ -298,97 +522,467 @@ fn start_ssh_monitor_task(
                             Some(n) => format!("-n {} --ntasks-per-node=1", n),
                             None => "--ntasks-per-node=1".to_string(),
                         };
-                        format!("srun --jobid {} --overlap {} --label --job-name=widgitron-gpu sh -c 'while true; do {}; echo \"END_BATCH\"; sleep {}; done'", id, n_arg, smi_cmd, interval)
+                        format!("srun --jobid {} --overlap {} --label --job-name=widgitron-gpu {}", id, n_arg, smi_m)
                     },
-                    None => format!("sh -c 'while true; do {}; echo \"END_BATCH\"; sleep {}; done'", smi_cmd, interval),
+                    None => smi_m,
                 };
                 
                 if channel.exec(&watch_cmd).is_err() { return None; }
+                sess.set_timeout(stream_timeout.as_millis().min(u32::MAX as u128) as u32);
                 
-                let mut task_batches: HashMap<String, String> = HashMap::new();
-                let reader = std::io::BufReader::new(channel);
-                use std::io::BufRead;
-                for line in reader.lines() {
-                    if let Ok(l) = line {
-                        // Identify task ID from Slurm --label prefix (e.g., "0: ...")
-                        let task_id = if l.contains(": ") {
-                            let parts: Vec<&str> = l.splitn(2, ": ").collect();
-                            if parts.len() == 2 && parts[0].trim().chars().all(|c| c.is_numeric()) {
-                                parts[0].trim().to_string()
-                            } else { "default".to_string() }
-                        } else { "default".to_string() };
-
-                        if l.contains("END_BATCH") {
-                            let app_config_path = get_config_path(&app_inner, "app_config.json");
-                            let app_config_str = fs::read_to_string(&app_config_path).unwrap_or_default();
-                            let app_config: AppConfig = serde_json::from_str(&app_config_str).unwrap_or_default();
-                            if !app_config.gpu_enabled.unwrap_or(true) {
-                                return None;
+                let mut batcher = SmiStreamBatcher::default();
+                let mut sampled = false;
+                let mut reader = std::io::BufReader::new(channel);
+                // One line buffer for the life of the stream
+                let mut buf = Vec::new();
+                loop {
+                    buf.clear();
+                    match reader.read_until(b'\n', &mut buf) {
+                        Ok(0) | Err(_) => break,
+                        Ok(_) => {}
+                    }
+                    if let Ok(l) = std::str::from_utf8(&buf) {
+                        if let Some(mut parsed) = batcher.push(l.trim_end_matches(['\r', '\n'])) {
+                            sampled = true;
+                            // Aborting the task does not stop this thread, so end the stream ourselves
+                            let registered = state_inner.active_monitors.lock().map(|m| m.contains_key(&key_m)).unwrap_or(false);
+                            if !gpu_enabled(&app_inner) || !registered {
+                                let _ = reader.get_mut().close();
+                                return Some(true);
                             }
 
-                            let batch = task_batches.entry(task_id.clone()).or_default();
-                            let mut parsed = parse_nvidia_smi_output(batch);
-                            if !parsed.is_empty() {
-                                for p in &mut parsed { p.job_id = j_m.clone(); }
+                            for p in &mut parsed { p.job_id = j_m.clone(); }
+                            
+                            let node_to_replace = parsed[0].node.clone();
+
+                            if let Ok(mut state_gpu) = state_inner.gpu_data.lock() {
+                                let data = state_gpu.entry(s_m.host.clone()).or_insert(ServerGpuData {
+                                    host: s_m.host.clone(), is_online: true, gpu_list: vec![], error: None, last_update: None
+                                });
                                 
-                                let node_to_replace = parsed[0].node.clone();
-
-                                if let Ok(mut state_gpu) = state_inner.gpu_data.lock() {
-                                    let data = state_gpu.entry(s_m.host.clone()).or_insert(ServerGpuData {
-                                        host: s_m.host.clone(), is_online: true, gpu_list: vec![], error: None, last_update: None
-                                    });
-                                    
-                                    if let Some(node) = node_to_replace {
-                                        data.gpu_list.retain(|g| !(g.job_id == j_m && g.node == Some(node.clone())));
-                                    } else {
-                                        data.gpu_list.retain(|g| g.job_id != j_m);
-                                    }
-                                    
-                                    data.gpu_list.extend(parsed.clone());
-                                    data.last_update = Some(Utc::now().format("%H:%M:%S").to_string());
-                                    let data_clone = data.clone();
-                                    let _ = app_inner.emit("gpu_update", data_clone);
+                                if let Some(node) = node_to_replace {
+                                    data.gpu_list.retain(|g| !(g.job_id == j_m && g.node == Some(node.clone())));
+                                } else {
+                                    data.gpu_list.retain(|g| g.job_id != j_m);
                                 }
+                                
+                                data.gpu_list.extend(parsed);
+                                data.last_update = Some(Utc::now().format("%H:%M:%S").to_string());
+                                emit_gpu_update(&app_inner, &state_inner, data);
                             }
-                            batch.clear();
-                        } else {
-                            let batch = task_batches.entry(task_id).or_default();
-                            batch.push_str(&l);
-                            batch.push('\n');
                         }
                     }
                 }
-                Some(())
+                // A stream that ended without a single sample (no nvidia-smi, srun refused,
+                // job already gone) is a failure, so the retry backs off
+                sampled.then_some(false)
             }).await;
             
-            if res.is_err() || res.unwrap().is_none() {
-                tokio::time::sleep(Duration::from_secs(10)).await;
-            } else {
-                tokio::time::sleep(Duration::from_secs(5)).await;
+            match res {
+                Ok(Some(true)) => return,
+                Ok(Some(false)) => {
+                    failures = 0;
+                    tokio::time::sleep(Duration::from_secs(5)).await;
+                }
+                _ => {
+                    tokio::time::sleep(backoff_delay(failures)).await;
+                    failures += 1;
+                }
             }
         }
     })
 }
 
+// Loaded once; None when the NVIDIA driver library is unavailable
+static NVML: Lazy<Option<nvml_wrapper::Nvml>> = Lazy::new(|| nvml_wrapper::Nvml::init().ok());
+
+// `names` caches the product names, which never change while the driver is loaded;
+// it is refilled only when the device count changes
+fn sample_nvml(nvml: &nvml_wrapper::Nvml, names: &mut Vec<String>) -> Result<Vec<GpuInfo>, String> {
+    use nvml_wrapper::enum_wrappers::device::TemperatureSensor;
+    let count = nvml.device_count().map_err(|e| e.to_string())?;
+    if names.len() != count as usize {
+        names.clear();
+        for i in 0..count {
+            let dev = nvml.device_by_index(i).map_err(|e| e.to_string())?;
+            names.push(dev.name().unwrap_or_default());
+        }
+    }
+    let mut list = Vec::with_capacity(count as usize);
+    for (i, name) in (0..count).zip(names.iter()) {
+        let dev = nvml.device_by_index(i).map_err(|e| e.to_string())?;
+        // One call returns both counters; total comes along for free
+        let mem = dev.memory_info().map_err(|e| e.to_string())?;
+        list.push(GpuInfo {
+            name: name.clone(),
+            // MiB, matching nvidia-smi's nounits output
+            mem_used: (mem.used / (1024 * 1024)) as u32,
+            mem_total: (mem.total / (1024 * 1024)) as u32,
+            util: dev.utilization_rates().map(|u| u.gpu).unwrap_or(0),
+            temp: dev.temperature(TemperatureSensor::Gpu).ok().map(|t| t as f32),
+            power: dev.power_usage().ok().map(|mw| mw as f32 / 1000.0),
+            job_id: None,
+            node: None,
+        });
+    }
+    Ok(list)
+}
+
+fn start_local_monitor_task(
+    app: AppHandle,
+    state: Arc<GlobalState>,
+    host: String,
+    monitor_key: String,
+    interval: u64,
+) -> tokio::task::JoinHandle<()> {
+    tokio::spawn(async move {
+        // Query the driver in-process when possible; no child process at all. Loading the
+        // driver and each query block, so both run on the blocking pool.
+        if tokio::task::spawn_blocking(|| NVML.is_some()).await.unwrap_or(false) {
+            let mut names = Vec::new();
+            loop {
+                let sampled = tokio::task::spawn_blocking(move || {
+                    let res = NVML.as_ref()
+                        .ok_or_else(|| "NVML unavailable".to_string())
+                        .and_then(|nvml| sample_nvml(nvml, &mut names));
+                    (res, names)
+                }).await;
+                let res = match sampled {
+                    Ok((res, n)) => { names = n; res }
+                    Err(e) => { names = Vec::new(); Err(e.to_string()) }
+                };
+                let gpu_data = match res {
+                    Ok(gpu_list) => ServerGpuData {
+                        host: host.clone(), is_online: true, gpu_list, error: None,
+                        last_update: Some(Utc::now().format("%H:%M:%S").to_string()),
+                    },
+                    Err(e) => ServerGpuData {
+                        host: host.clone(), is_online: false, gpu_list: vec![],
+                        error: Some(format!("NVML query failed: {}", e)), last_update: None,
+                    },
+                };
+                if let Ok(mut data) = state.gpu_data.lock() {
+                    data.insert(host.clone(), gpu_data.clone());
+                }
+                emit_gpu_update(&app, &state, &gpu_data);
+                // Follows interval changes without a restart
+                let interval = gpu_update_interval(&app).unwrap_or(interval);
+                tokio::time::sleep(Duration::from_secs(interval)).await;
+            }
+        }
+
+        // Otherwise stream from nvidia-smi
+        let mut failures = 0;
+        loop {
+            let app_inner = app.clone();
+            let state_inner = state.clone();
+            let host_m = host.clone();
+            let key_m = monitor_key.clone();
+
+            // Ok(true): monitoring was switched off; Ok(false): a working stream ended
+            let res = tokio::task::spawn_blocking(move || -> Result<bool, String> {
+                // Direct execution to avoid shell (and its .bashrc hooks)
+                let mut cmd = std::process::Command::new("nvidia-smi");
+                cmd.args([SMI_QUERY, SMI_FORMAT, "-lms", &(interval * 1000).to_string()])
+                    .stdout(std::process::Stdio::piped())
+                    .stderr(std::process::Stdio::null());
+                #[cfg(windows)]
+                cmd.creation_flags(0x08000000); // CREATE_NO_WINDOW
+
+                let mut child = cmd.spawn().map_err(|e| format!("Local smi failed: {}", e))?;
+                let stdout = child.stdout.take().ok_or_else(|| "Local smi has no stdout".to_string())?;
+
+                let mut batcher = SmiStreamBatcher::default();
+                let mut sampled = false;
+                let mut reader = std::io::BufReader::new(stdout);
+                let mut buf = Vec::new();
+                loop {
+                    buf.clear();
+                    match reader.read_until(b'\n', &mut buf) {
+                        Ok(0) | Err(_) => break,
+                        Ok(_) => {}
+                    }
+                    let Ok(l) = std::str::from_utf8(&buf) else { continue };
+                    if let Some(gpu_list) = batcher.push(l.trim_end_matches(['\r', '\n'])) {
+                        sampled = true;
+                        // Aborting the task does not stop this thread, so stop the sampler ourselves
+                        let registered = state_inner.active_monitors.lock().map(|m| m.contains_key(&key_m)).unwrap_or(false);
+                        if !gpu_enabled(&app_inner) || !registered {
+                            let _ = child.kill();
+                            let _ = child.wait();
+                            return Ok(true);
+                        }
+
+                        let gpu_data = ServerGpuData {
+                            host: host_m.clone(),
+                            is_online: true,
+                            gpu_list,
+                            error: None,
+                            last_update: Some(Utc::now().format("%H:%M:%S").to_string()),
+                        };
+                        if let Ok(mut data) = state_inner.gpu_data.lock() {
+                            data.insert(host_m.clone(), gpu_data.clone());
+                        }
+                        emit_gpu_update(&app_inner, &state_inner, &gpu_data);
+                    }
+                }
+
+                let _ = child.kill();
+                let _ = child.wait();
+                if sampled { Ok(false) } else { Err("Local smi exited".to_string()) }
+            }).await;
+
+            match res {
+                Ok(Ok(true)) => return,
+                Ok(Ok(false)) => failures = 0,
+                Ok(Err(e)) => {
+                    let gpu_data = ServerGpuData {
+                        host: host.clone(), is_online: false, gpu_list: vec![], error: Some(e), last_update: None
+                    };
+                    if let Ok(mut data) = state.gpu_data.lock() {
+                        data.insert(host.clone(), gpu_data.clone());
+                    }
+                    emit_gpu_update(&app, &state, &gpu_data);
+                }
+                Err(_) => {}
+            }
+            tokio::time::sleep(backoff_delay(failures)).await;
+            failures += 1;
+        }
+    })
+}
+
+// Running jobs change slowly; refresh the squeue listing at most this often
+const SQUEUE_REFRESH: Duration = Duration::from_secs(30);
+
+fn squeue_due(last: Option<std::time::Instant>) -> bool {
+    last.map_or(true, |t| t.elapsed() >= SQUEUE_REFRESH)
+}
+
+// Worker tick length: the configured interval, doubled for each consecutive tick that
+// changed nothing, up to the squeue cadence (never below the configured interval).
+// Once samplers stream a host's GPUs the worker only has status and job changes to
+// notice, so idle hosts settle at one tick per SQUEUE_REFRESH.
+fn worker_step(interval: u64, idle_ticks: u32) -> Duration {
+    let base = Duration::from_secs(interval);
+    (base * (1u32 << idle_ticks.min(4))).min(SQUEUE_REFRESH.max(base))
+}
+
+// Ok((session, jobs, changed)) from one worker tick; `changed` is false when the tick altered nothing
+type WorkerTick = Result<(Option<Session>, Vec<(String, String)>, bool), String>;
+
+// Localhost: make sure the in-process NVML sampler is running; it publishes into the shared state itself
+fn local_worker_tick(app: &AppHandle, state: &Arc<GlobalState>, s: &ServerConfig, update_interval: u64) -> WorkerTick {
+    // The nvidia-smi fallback streams at the -lms period it started with, so the key
+    // carries the interval and a changed interval replaces the sampler
+    let local_prefix = format!("{}:local:", s.host);
+    let key = format!("{}{}", local_prefix, update_interval);
+    let mut monitors = state.active_monitors.lock().unwrap();
+    monitors.retain(|k, h| {
+        let stale = k.starts_with(&local_prefix) && *k != key;
+        if stale { h.abort(); }
+        !stale
+    });
+    let needs_start = match monitors.get(&key) {
+        None => true,
+        Some(h) => h.is_finished(),
+    };
+    if needs_start {
+        let handle = start_local_monitor_task(
+            app.clone(),
+            state.clone(),
+            s.host.clone(),
+            key.clone(),
+            update_interval,
+        );
+        monitors.insert(key, handle);
+    }
+
+    Ok((None, vec![], false))
+}
+
+// Remote: (re)connect if needed, refresh Slurm jobs, keep the per-job samplers running
+// and fall back to a one-shot poll while no sampler has reported yet
+fn ssh_worker_tick(
+    app: &AppHandle,
+    state: &Arc<GlobalState>,
+    s: &Arc<ServerConfig>,
+    smi: &str,
+    sess_opt: Option<Session>,
+    mut jobs: Vec<(String, String)>,
+    squeue_needed: bool,
+    update_interval: u64,
+) -> WorkerTick {
+    let sess = match sess_opt {
+        // A dropped transport fails the keepalive write; no probe channel needed
+        Some(sess) if sess.authenticated() && sess.keepalive_send().is_ok() => sess,
+        _ => {
+            let tcp = TcpStream::connect(s.addr()).map_err(|e| format!("TCP connect failed: {}", e))?;
+            let _ = tcp.set_read_timeout(Some(Duration::from_secs(30)));
+            let mut sess = Session::new().map_err(|e| e.to_string())?;
+            sess.set_timeout(SESSION_TIMEOUT_MS);
+            sess.set_tcp_stream(tcp);
+            sess.handshake().map_err(|e| format!("SSH handshake failed: {}", e))?;
+            ssh_authenticate(&mut sess, s)?;
+            if !sess.authenticated() {
+                return Err("SSH authentication failed".to_string());
+            }
+            sess.set_keepalive(true, 15);
+            sess
+        }
+    };
+
+    let mut desired_monitor_keys = Vec::new();
+    // When the fallback poll will be needed anyway, ride along on the squeue exec
+    let cached_empty = state.gpu_data.lock()
+        .map(|d| d.get(&s.host).map_or(true, |c| c.gpu_list.is_empty()))
+        .unwrap_or(true);
+    let mut prefetched_smi: Option<String> = None;
+
+    if s.use_slurm.unwrap_or(false) {
+        if squeue_needed {
+            let user = s.user_name();
+            let mut q_cmd = format!("squeue --me -t RUNNING -h -o \"%A|%D\" 2>/dev/null || squeue -t RUNNING -u $(whoami) -h -o \"%A|%D\" || squeue -t RUNNING -u {} -h -o \"%A|%D\"", user);
+            if cached_empty {
+                q_cmd = format!("{}; echo {}; {}", q_cmd, SMI_SECTION_MARK, smi);
+            }
+            // On timeout keep the previous job list rather than tearing monitors down
+            if let Some(mut s_q) = exec_bounded(&sess, &q_cmd) {
+                if let Some((q_out, smi_out)) = s_q.split_once(SMI_SECTION_MARK) {
+                    prefetched_smi = Some(smi_out.to_string());
+                    s_q.truncate(q_out.len());
+                }
+                jobs = s_q.lines().map(str::trim).filter(|l| !l.is_empty()).map(|line| {
+                    let mut parts = line.split('|');
+                    let jid = parts.next().unwrap_or(line);
+                    let nodes = parts.next().unwrap_or("1");
+                    (jid.to_string(), nodes.to_string())
+                }).collect();
+            }
+        }
+        for (jid, n_count) in &jobs {
+            desired_monitor_keys.push(format!("{}:{}:{}:{}", s.host, jid, n_count, update_interval));
+        }
+    } else {
+        desired_monitor_keys.push(format!("{}:node:0:{}", s.host, update_interval));
+    }
+
+    // Ensure monitor tasks are running
+    for key in &desired_monitor_keys {
+        let mut monitors = state.active_monitors.lock().unwrap();
+        let needs_start = match monitors.get(key) {
+            None => true,
+            Some(h) => h.is_finished(),
+        };
+        if needs_start {
+            // Keys are "host:jid:nodes:interval" or "host:node:0:interval"; samplers stream at a
+            // fixed -lms period, so a new interval means a new key and a restarted sampler.
+            // Parse past the host, which may contain colons.
+            let parts: Vec<&str> = key[s.host.len() + 1..].split(':').collect();
+            let (jid, n_count) = if parts.len() >= 2 {
+                if parts[0] == "node" { (None, None) }
+                else { (Some(parts[0].to_string()), Some(parts[1].to_string())) }
+            } else { (None, None) };
+
+            let handle = start_ssh_monitor_task(
+                app.clone(),
+                state.clone(),
+                s.clone(),
+                key.clone(),
+                jid,
+                n_count,
+                update_interval,
+            );
+            monitors.insert(key.clone(), handle);
+        }
+    }
+
+    // Cleanup monitors for THIS host that are no longer needed
+    {
+        let mut monitors = state.active_monitors.lock().unwrap();
+        let host_prefix = format!("{}:", s.host);
+        let mut removed_jids = Vec::new();
+        monitors.retain(|key, handle| {
+            if key.starts_with(&host_prefix) {
+                if !desired_monitor_keys.contains(key) {
+                    handle.abort();
+                    // A sampler replaced for a new interval keeps its job's rows until the new one reports
+                    let jid = key[host_prefix.len()..].split(':').next().unwrap_or_default();
+                    let job_prefix = format!("{}{}:", host_prefix, jid);
+                    if !jid.is_empty() && jid != "node" && !desired_monitor_keys.iter().any(|k| k.starts_with(&job_prefix)) {
+                        removed_jids.push(jid.to_string());
+                    }
+                    false
+                } else {
+                    true
+                }
+            } else {
+                true
+            }
+        });
+
+        if !removed_jids.is_empty() {
+            if let Ok(mut data) = state.gpu_data.lock() {
+                if let Some(server_data) = data.get_mut(&s.host) {
+                    server_data.gpu_list.retain(|g| {
+                        if let Some(jid) = &g.job_id {
+                            !removed_jids.contains(jid)
+                        } else {
+                            true
+                        }
+                    });
+                }
+            }
+        }
+    }
+
+    // Fallback poll if no jobs or no data yet. Otherwise the samplers own
+    // gpu_list and have already published it; don't copy it back over
+    // newer rows or re-send it.
+    let needs_poll = state.gpu_data.lock()
+        .map(|d| d.get(&s.host).map_or(true, |c| c.gpu_list.is_empty()))
+        .unwrap_or(true);
+    let mut polled = None;
+    if needs_poll {
+        if let Some(out) = &prefetched_smi {
+            polled = Some(parse_nvidia_smi_output(out));
+        } else if let Some(s_out) = exec_bounded(&sess, smi) {
+            polled = Some(parse_nvidia_smi_output(&s_out));
+        }
+    }
+
+    let mut changed = false;
+    if let Ok(mut data) = state.gpu_data.lock() {
+        let entry = data.entry(s.host.clone()).or_insert_with(|| ServerGpuData {
+            host: s.host.clone(), is_online: true, gpu_list: vec![], error: None, last_update: None
+        });
+        if let Some(gpu_list) = polled {
+            entry.gpu_list = gpu_list;
+            entry.last_update = Some(Utc::now().format("%H:%M:%S").to_string());
+        }
+        entry.is_online = true;
+        entry.error = None;
+        // Only goes out if the status or the job cleanup above changed something
+        changed = emit_gpu_update(app, state, entry);
+    } else {
+        println!("ERROR: gpu_data lock poisoned in main worker for {}", s.host);
+    }
+
+    Ok((Some(sess), jobs, changed))
+}
+
 async fn start_gpu_monitor(app: AppHandle, state: Arc<GlobalState>) {
-    let smi_cmd = "nvidia-smi --query-gpu=name,memory.used,memory.total,utilization.gpu,temperature.gpu,power.draw --format=csv,noheader,nounits";
+    let smi_cmd = smi_command(None);
 
     loop {
-        let app_config_path = get_config_path(&app, "app_config.json");
-        let app_config_str = fs::read_to_string(&app_config_path).unwrap_or_default();
-        let app_config: AppConfig = serde_json::from_str(&app_config_str).unwrap_or_default();
-        let gpu_enabled = app_config.gpu_enabled.unwrap_or(true);
-
-        let config_path = get_config_path(&app, "gpu_monitor.json");
-        let config_str = fs::read_to_string(&config_path).unwrap_or_default();
-        let config: GpuConfig = serde_json::from_str(&config_str).unwrap_or_else(|_| {
+        let config: GpuConfig = load_config(&get_config_path(&app, "gpu_monitor.json")).unwrap_or_else(|| {
             GpuConfig { servers: vec![], update_interval: Some(5) }
         });
 
         let mut current_server_ids = Vec::new();
-        if gpu_enabled {
+        if gpu_enabled(&app) {
             for server in &config.servers {
-                let server_id = format!("{}:{}", server.host, server.port.unwrap_or(22));
+                let server_id = server.addr();
                 current_server_ids.push(server_id.clone());
 
                 let mut workers = state.active_workers.lock().unwrap();
@@ -399,224 +993,77 @@ async fn start_gpu_monitor(app: AppHandle, state: Arc<GlobalState>) {
                 if needs_start {
                     let app_inner = app.clone();
                     let state_inner = state.clone();
-                    let server_inner = server.clone();
-                    let smi_cmd_inner = smi_cmd.to_string();
-                    let update_interval = config.update_interval.unwrap_or(5);
+                    // Shared with every tick's blocking task and the per-job samplers
+                    let server_inner = Arc::new(server.clone());
+                    let smi_cmd_inner = smi_cmd.clone();
+                    let mut update_interval = config.update_interval.unwrap_or(5);
+                    // The transport never changes for a worker, so pick it once
+                    let local = is_local_host(&server.host);
 
                     let handle = tokio::spawn(async move {
                     println!("--- Starting persistent worker for host: {} ---", server_inner.host);
                     let mut session: Option<Session> = None;
-                    let mut last_squeue_update = Utc::now() - Duration::from_secs(60);
-                    let mut slurm_job_ids: Vec<String> = Vec::new();
+                    let mut last_squeue_update: Option<std::time::Instant> = None;
+                    // (job id, node count) from the last squeue refresh, reused on the ticks in between
+                    let mut slurm_jobs: Vec<(String, String)> = Vec::new();
+                    let mut failures = 0;
+                    let mut idle_ticks = 0;
+                    let mut next_tick = tokio::time::Instant::now();
 
                     loop {
+                        // Picked up from the (cached) config every tick, so a new interval needs no restart
+                        if let Some(i) = gpu_update_interval(&app_inner) {
+                            update_interval = i;
+                        }
+                        next_tick += worker_step(update_interval, idle_ticks);
+                        if !gpu_view_visible(&app_inner) {
+                            tokio::time::sleep_until(next_tick).await;
+                            continue;
+                        }
+
                         let res = tokio::task::spawn_blocking({
                             let s = server_inner.clone();
                             let smi = smi_cmd_inner.clone();
                             let state_task = state_inner.clone();
                             let app_task = app_inner.clone();
                             let sess_opt = session.take();
-                            let mut job_ids = slurm_job_ids.clone();
-                            let squeue_needed = (Utc::now() - last_squeue_update).num_seconds() >= 30;
-
-                            move || -> Result<(Option<Session>, Vec<String>), String> {
-                                let mut gpu_data = ServerGpuData {
-                                    host: s.host.clone(),
-                                    is_online: false,
-                                    gpu_list: vec![],
-                                    error: None,
-                                    last_update: None,
-                                };
-
-                                if s.host == "localhost" || s.host == "127.0.0.1" {
-                                    // Direct execution to avoid shell (and its .bashrc hooks)
-                                    let local_smi_args = ["--query-gpu=name,memory.used,memory.total,utilization.gpu,temperature.gpu,power.draw", "--format=csv,noheader,nounits"];
-                                    #[cfg(windows)]
-                                    let output = std::process::Command::new("nvidia-smi")
-                                        .args(local_smi_args)
-                                        .creation_flags(0x08000000) // CREATE_NO_WINDOW
-                                        .output();
-                                    #[cfg(not(windows))]
-                                    let output = std::process::Command::new("nvidia-smi")
-                                        .args(local_smi_args)
-                                        .output();
-
-                                    match output {
-                                        Ok(out) => {
-                                            let s_out = String::from_utf8_lossy(&out.stdout);
-                                            gpu_data.gpu_list = parse_nvidia_smi_output(&s_out);
-                                            gpu_data.is_online = true;
-                                        }
-                                        Err(e) => { gpu_data.error = Some(format!("Local smi failed: {}", e)); }
-                                    }
-                                    
-                                    if let Ok(mut data) = state_task.gpu_data.lock() {
-                                        data.insert(s.host.clone(), gpu_data.clone());
-                                    }
-                                    let _ = app_task.emit("gpu_update", gpu_data);
-                                    
-                                    Ok((None, vec![]))
-                                } else {
-                                    // SSH Logic
-                                    let sess = match sess_opt {
-                                        Some(sess) => sess,
-                                        None => {
-                                            let host_id = format!("{}:{}", s.host, s.port.unwrap_or(22));
-                                            let tcp = TcpStream::connect(&host_id).map_err(|e| format!("TCP connect failed: {}", e))?;
-                                            let _ = tcp.set_read_timeout(Some(Duration::from_secs(30)));
-                                            let mut sess = Session::new().map_err(|e| e.to_string())?;
-                                            sess.set_timeout(30000);
-                                            sess.set_tcp_stream(tcp);
-                                            sess.handshake().map_err(|e| format!("SSH handshake failed: {}", e))?;
-                                            ssh_authenticate(&mut sess, &s)?;
-                                            sess
-                                        }
-                                    };
+                            let jobs = slurm_jobs.clone();
+                            let squeue_needed = squeue_due(last_squeue_update);
 
-                                    gpu_data.is_online = true;
-                                    let mut desired_monitor_keys = Vec::new();
-                                    
-                                    if s.use_slurm.unwrap_or(false) {
-                                        let mut job_nodes = HashMap::new();
-                                        if squeue_needed {
-                                            let user = s.user.as_deref().unwrap_or("root");
-                                            if let Ok(mut channel) = sess.channel_session() {
-                                                let q_cmd = format!("squeue --me -t RUNNING -h -o \"%A|%D\" 2>/dev/null || squeue -t RUNNING -u $(whoami) -h -o \"%A|%D\" || squeue -t RUNNING -u {} -h -o \"%A|%D\"", user);
-                                                if let Ok(_) = channel.exec(&q_cmd) {
-                                                    let mut s_q = String::new();
-                                                    let _ = channel.read_to_string(&mut s_q);
-                                                    let lines: Vec<String> = s_q.lines().map(|l| l.trim().to_string()).filter(|l| !l.is_empty()).collect();
-                                                    for line in lines {
-                                                        let parts: Vec<&str> = line.split('|').collect();
-                                                        if parts.len() >= 2 {
-                                                            job_nodes.insert(parts[0].to_string(), parts[1].to_string());
-                                                        } else if !line.is_empty() {
-                                                            job_nodes.insert(line, "1".to_string());
-                                                        }
-                                                    }
-                                                    job_ids = job_nodes.keys().cloned().collect();
-                                                }
-                                            }
-                                        }
-                                        for jid in &job_ids {
-                                            let n_count = job_nodes.get(jid).cloned().unwrap_or_else(|| "1".to_string());
-                                            desired_monitor_keys.push(format!("{}:{}:{}", s.host, jid, n_count));
-                                        }
-                                    } else {
-                                        desired_monitor_keys.push(format!("{}:node:0", s.host));
-                                    }
-
-                                    // Ensure monitor tasks are running
-                                    for key in &desired_monitor_keys {
-                                        let mut monitors = state_task.active_monitors.lock().unwrap();
-                                        let needs_start = match monitors.get(key) {
-                                            None => true,
-                                            Some(h) => h.is_finished(),
-                                        };
-                                        if needs_start {
-                                            let parts: Vec<&str> = key.split(':').collect();
-                                            let (jid, n_count) = if parts.len() >= 3 {
-                                                if parts[1] == "node" { (None, None) } 
-                                                else { (Some(parts[1].to_string()), Some(parts[2].to_string())) }
-                                            } else { (None, None) };
-
-                                            let handle = start_ssh_monitor_task(
-                                                app_task.clone(),
-                                                state_task.clone(),
-                                                s.clone(),
-                                                jid,
-                                                n_count,
-                                                update_interval,
-                                            );
-                                            monitors.insert(key.clone(), handle);
-                                        }
-                                    }
-                                    
-                                    // Cleanup monitors for THIS host that are no longer needed
-                                    {
-                                        let mut monitors = state_task.active_monitors.lock().unwrap();
-                                        let host_prefix = format!("{}:", s.host);
-                                        let mut removed_jids = Vec::new();
-                                        monitors.retain(|key, handle| {
-                                            if key.starts_with(&host_prefix) {
-                                                if !desired_monitor_keys.contains(key) {
-                                                    handle.abort();
-                                                    let parts: Vec<&str> = key.split(':').collect();
-                                                    if parts.len() >= 2 && parts[1] != "node" {
-                                                        removed_jids.push(parts[1].to_string());
-                                                    }
-                                                    false
-                                                } else {
-                                                    true
-                                                }
-                                            } else {
-                                                true
-                                            }
-                                        });
-
-                                        if !removed_jids.is_empty() {
-                                            if let Ok(mut data) = state_task.gpu_data.lock() {
-                                                if let Some(server_data) = data.get_mut(&s.host) {
-                                                    server_data.gpu_list.retain(|g| {
-                                                        if let Some(jid) = &g.job_id {
-                                                            !removed_jids.contains(jid)
-                                                        } else {
-                                                            true
-                                                        }
-                                                    });
-                                                }
-                                            }
-                                        }
-                                    }
-
-                                    // Sync GPU data from global state (updated by background monitors)
-                                    if let Ok(data) = state_task.gpu_data.lock() {
-                                        if let Some(cached) = data.get(&s.host) {
-                                            gpu_data.gpu_list = cached.gpu_list.clone();
-                                        }
-                                    }
-
-                                    // Fallback poll if no jobs or no data yet
-                                    if gpu_data.gpu_list.is_empty() {
-                                        if let Ok(mut channel) = sess.channel_session() {
-                                            if let Ok(_) = channel.exec(&smi) {
-                                                let mut s_out = String::new();
-                                                let _ = channel.read_to_string(&mut s_out);
-                                                gpu_data.gpu_list = parse_nvidia_smi_output(&s_out);
-                                            }
-                                        }
-                                    }
-                                    
-                                    if let Ok(mut data) = state_task.gpu_data.lock() {
-                                        gpu_data.last_update = Some(Utc::now().format("%H:%M:%S").to_string());
-                                        data.insert(s.host.clone(), gpu_data.clone());
-                                    } else {
-                                        println!("ERROR: gpu_data lock poisoned in main worker for {}", s.host);
-                                    }
-                                    println!("Main Worker for {} emitting update", s.host);
-                                    let _ = app_task.emit("gpu_update", gpu_data);
-                                    
-                                    Ok((Some(sess), job_ids))
+                            move || -> WorkerTick {
+                                if local {
+                                    local_worker_tick(&app_task, &state_task, &s, update_interval)
+                                } else {
+                                    ssh_worker_tick(&app_task, &state_task, &s, &smi, sess_opt, jobs, squeue_needed, update_interval)
                                 }
                             }
                         }).await;
 
                         match res {
-                            Ok(Ok((sess, jobs))) => {
+                            Ok(Ok((sess, jobs, changed))) => {
                                 session = sess;
-                                slurm_job_ids = jobs;
-                                if (Utc::now() - last_squeue_update).num_seconds() >= 30 {
-                                    last_squeue_update = Utc::now();
+                                slurm_jobs = jobs;
+                                failures = 0;
+                                idle_ticks = if changed { 0 } else { idle_ticks + 1 };
+                                if squeue_due(last_squeue_update) {
+                                    last_squeue_update = Some(std::time::Instant::now());
                                 }
                             }
                             _ => {
-                                println!("Worker for {} failed or disconnected, retrying in 10s", server_inner.host);
+                                let delay = backoff_delay(failures);
+                                failures += 1;
+                                println!("Worker for {} failed or disconnected, retrying in {}s", server_inner.host, delay.as_secs());
                                 session = None;
-                                tokio::time::sleep(Duration::from_secs(10)).await;
+                                idle_ticks = 0;
+                                tokio::time::sleep(delay).await;
                             }
                         }
 
-                        tokio::time::sleep(Duration::from_secs(update_interval)).await;
+                        // Fixed-rate schedule on the monotonic clock: time spent polling comes out of
+                        // the wait instead of pushing every later tick back
+                        let now = tokio::time::Instant::now();
+                        if next_tick < now { next_tick = now; }
+                        tokio::time::sleep_until(next_tick).await;
                     }
                 });
                 workers.insert(server_id, handle);
@@ -627,17 +1074,22 @@ async fn start_gpu_monitor(app: AppHandle, state: Arc<GlobalState>) {
         if let Ok(mut data) = state.gpu_data.lock() {
             data.clear();
         }
+        if let Ok(mut emitted) = state.gpu_emitted.lock() {
+            emitted.clear();
+        }
         let _ = app.emit("gpu_clear", ());
     }
 
     // Cleanup workers for removed servers
     {
+        let mut removed_hosts = Vec::new();
         let mut workers = state.active_workers.lock().unwrap();
             workers.retain(|id, handle| {
                 if !current_server_ids.contains(id) {
                     handle.abort();
-                    // Also cleanup monitors for this host
-                    let host = id.split(':').next().unwrap_or_default();
+                    // Also cleanup monitors for this host. The id is "host:port" and the
+                    // host itself may contain colons (::1), so split at the last one.
+                    let host = id.rsplit_once(':').map_or("", |(h, _)| h);
                     if !host.is_empty() {
                         let mut monitors = state.active_monitors.lock().unwrap();
                         let prefix = format!("{}:", host);
@@ -647,99 +1099,233 @@ async fn start_gpu_monitor(app: AppHandle, state: Arc<GlobalState>) {
                                 false
                             } else { true }
                         });
+                        if !current_server_ids.iter().any(|c| c.starts_with(&prefix)) {
+                            removed_hosts.push(host.to_string());
+                        }
                     }
                     false
                 } else {
                     true
                 }
             });
+
+        // Drop the last readings of removed servers so they neither linger in the UI nor
+        // get served by get_gpu_data
+        for host in removed_hosts {
+            let had_data = state.gpu_data.lock().map(|mut d| d.remove(&host).is_some()).unwrap_or(false);
+            if let Ok(mut emitted) = state.gpu_emitted.lock() {
+                emitted.remove(&host);
+            }
+            if had_data {
+                let _ = app.emit("gpu_remove", &host);
+            }
+        }
         }
 
-        tokio::time::sleep(Duration::from_secs(1)).await; // Re-check config every 1s
+        // Woken by the save commands; the slow fallback catches edits made outside the app
+        tokio::select! {
+            _ = state.gpu_config_changed.notified() => {}
+            _ = tokio::time::sleep(Duration::from_secs(30)) => {}
+        }
     }
 }
 
 
-fn process_deadlines(app: AppHandle, state: Arc<GlobalState>, config: PaperConfig, text: String) {
-    let app_inner = app.clone();
-    let config_inner = config.clone();
-    let state_inner = state.clone();
-
-    // Offload heavy YAML parsing and processing to blocking thread
-    tokio::task::spawn_blocking(move || {
-        match serde_yaml::from_str::<Vec<YamlConfItem>>(&text) {
-            Ok(items) => {
-                let mut deadlines = Vec::new();
-                let now = Utc::now();
+// The shapes ccfddl actually uses, "YYYY-MM-DD" and "YYYY-MM-DD HH:MM:SS", read straight
+// off the bytes; anything else is left to the RFC 3339 path
+fn parse_naive_deadline(dl: &str) -> Option<NaiveDateTime> {
+    let b = dl.as_bytes();
+    let num = |r: std::ops::Range<usize>| -> Option<u32> {
+        b.get(r)?.iter().try_fold(0u32, |n, &c| c.is_ascii_digit().then(|| n * 10 + (c - b'0') as u32))
+    };
+    if !(b.len() == 10 || b.len() == 19) || b[4] != b'-' || b[7] != b'-' { return None; }
+    let date = NaiveDate::from_ymd_opt(num(0..4)? as i32, num(5..7)?, num(8..10)?)?;
+    if b.len() == 10 { return date.and_hms_opt(23, 59, 59); }
+    if !matches!(b[10], b' ' | b'T') || b[13] != b':' || b[16] != b':' { return None; }
+    date.and_hms_opt(num(11..13)?, num(14..16)?, num(17..19)?)
+}
 
-                for item in items {
-                    let rank = item.rank.and_then(|r| r.ccf).unwrap_or_else(|| "N".to_string());
-                    let sub = item.sub.unwrap_or_else(|| "Unknown".to_string());
+// A conference's `timezone` as a fixed offset: "AoE" (UTC-12), "UTC", or "UTC±H[:MM]".
+// Anything else (named zones are not used by ccfddl) is None and the caller assumes UTC.
+fn tz_offset(tz: &str) -> Option<FixedOffset> {
+    let tz = tz.trim();
+    if tz.eq_ignore_ascii_case("AoE") { return FixedOffset::west_opt(12 * 3600); }
+    let rest = tz.strip_prefix("UTC").or_else(|| tz.strip_prefix("GMT"))?;
+    if rest.is_empty() { return FixedOffset::east_opt(0); }
+    let sign = match rest.as_bytes()[0] {
+        b'+' => 1,
+        b'-' => -1,
+        _ => return None,
+    };
+    let (h, m) = rest[1..].split_once(':').unwrap_or((&rest[1..], "0"));
+    let (h, m) = (h.parse::<u32>().ok()?, m.parse::<u32>().ok()?);
+    // Real zones span UTC-12 to UTC+14; anything else is a typo, left to the UTC fallback
+    let secs = h.checked_mul(3600)?.checked_add(m.checked_mul(60)?)?;
+    if m >= 60 || secs > 14 * 3600 { return None; }
+    FixedOffset::east_opt(sign * secs as i32)
+}
 
-                    if let Some(allowed) = &config_inner.filter_by_rank {
-                        if !allowed.is_empty() && !allowed.contains(&rank) { continue; }
-                    }
-                    if let Some(allowed) = &config_inner.filter_by_sub {
-                        if !allowed.is_empty() && !allowed.contains(&sub) { continue; }
-                    }
+// Date-only deadlines mean end of day; naive timestamps are local to `offset`, the
+// conference's timezone. Strings with their own offset (or Z) keep it.
+fn parse_deadline(dl: &str, offset: FixedOffset) -> Option<DateTime<Utc>> {
+    if dl == "TBD" { return None; }
+    if let Some(naive) = parse_naive_deadline(dl) {
+        return naive.and_local_timezone(offset).single().map(|d| d.with_timezone(&Utc));
+    }
+    let mut dt_str = dl.to_string();
+    if dt_str.len() == 10 {
+        dt_str.push_str("T23:59:59Z");
+    } else if !dt_str.ends_with('Z') && !dt_str.contains('+') {
+        dt_str.push_str("Z");
+    }
+    dt_str = dt_str.replace(" ", "T");
+    DateTime::parse_from_rfc3339(&dt_str).ok().map(|d| d.with_timezone(&Utc))
+}
 
-                    if let Some(confs) = item.confs {
-                        for conf in confs {
-                            if let Some(timeline) = conf.timeline {
-                                for t in timeline {
-                                    if let Some(dl) = t.deadline {
-                                        if dl == "TBD" { continue; }
-
-                                        let mut dt_str = dl.clone();
-                                        if dt_str.len() == 10 {
-                                            dt_str.push_str("T23:59:59Z");
-                                        } else if !dt_str.ends_with('Z') && !dt_str.contains('+') {
-                                            dt_str.push_str("Z");
-                                        }
-                                        dt_str = dt_str.replace(" ", "T");
-
-                                        if let Ok(parsed) = DateTime::parse_from_rfc3339(&dt_str) {
-                                            let utc_dt = parsed.with_timezone(&Utc);
-                                            if utc_dt >= now || config_inner.show_past_deadlines.unwrap_or(false) {
-                                                deadlines.push(PaperDeadlineInfo {
-                                                    title: item.title.clone(),
-                                                    year: conf.year.clone(),
-                                                    deadline_utc: utc_dt.to_rfc3339(),
-                                                    timezone: conf.timezone.clone().unwrap_or_else(|| "UTC".into()),
-                                                    rank: rank.clone(),
-                                                    sub: sub.clone(),
-                                                    place: conf.place.clone().unwrap_or_default(),
-                                                    link: conf.link.clone().unwrap_or_default(),
-                                                });
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
+// Takes the raw body: serde_yaml validates UTF-8 as it parses, so no decoded String copy is needed
+fn parse_conferences(bytes: &[u8]) -> Result<Vec<ConfDeadlines>, serde_yaml::Error> {
+    let items = serde_yaml::from_slice::<Vec<YamlConfItem>>(bytes)?;
+    Ok(items.into_iter().map(|item| {
+        let mut deadlines = Vec::new();
+        for conf in item.confs.unwrap_or_default() {
+            // Resolved once per conference year, shared by its whole timeline
+            let offset = conf.timezone.as_deref().and_then(tz_offset).unwrap_or_else(|| Utc.fix());
+            for t in conf.timeline.iter().flatten() {
+                if let Some(at) = t.deadline.as_deref().and_then(|dl| parse_deadline(dl, offset)) {
+                    deadlines.push(ConfDeadline {
+                        year: conf.year.clone(),
+                        timezone: conf.timezone.clone().unwrap_or_else(|| "UTC".into()),
+                        place: conf.place.clone().unwrap_or_default(),
+                        link: conf.link.clone().unwrap_or_default(),
+                        at: at.timestamp(),
+                    });
                 }
+            }
+        }
+        let rank = item.rank.and_then(|r| r.ccf).unwrap_or_else(|| "N".to_string());
+        ConfDeadlines {
+            title: item.title,
+            rank_bit: rank_bit(&rank),
+            rank,
+            sub: item.sub.unwrap_or_else(|| "Unknown".to_string()),
+            deadlines,
+        }
+    }).collect())
+}
 
-                deadlines.sort_by(|a, b| a.deadline_utc.cmp(&b.deadline_utc));
-                deadlines.truncate(config_inner.max_deadlines.unwrap_or(50));
+// CCF ranks are a closed set, so a rank filter is a bitmask; anything else gets 0
+fn rank_bit(rank: &str) -> u8 {
+    match rank {
+        "A" => 1,
+        "B" => 2,
+        "C" => 4,
+        "N" => 8,
+        _ => 0,
+    }
+}
 
-                {
-                    if let Ok(mut state_deadlines) = state_inner.deadlines.lock() {
-                        *state_deadlines = deadlines.clone();
-                    }
-                }
+// A sub filter as a set; None (or an empty list) means no filter
+fn filter_set(values: &Option<Vec<String>>) -> Option<HashSet<&str>> {
+    values.as_ref().filter(|v| !v.is_empty()).map(|v| v.iter().map(String::as_str).collect())
+}
 
-                if !deadlines.is_empty() {
-                    let _ = app_inner.emit("paper_update", &deadlines);
-                }
+// The deadlines `config` selects, soonest first and capped at max_deadlines
+fn filter_deadlines(confs: &[ConfDeadlines], config: &PaperConfig, now: DateTime<Utc>) -> Vec<PaperDeadlineInfo> {
+    let show_past = config.show_past_deadlines.unwrap_or(false);
+    let now_ts = now.timestamp();
+    // Built once per call: ranks become a mask test per conference, subs a hash probe.
+    // Rank strings outside the CCF set are rare and compared by name.
+    let ranks = config.filter_by_rank.as_ref().filter(|v| !v.is_empty()).map(|v| {
+        let mask = v.iter().fold(0, |m, r| m | rank_bit(r));
+        let others: Vec<&str> = v.iter().map(String::as_str).filter(|r| rank_bit(r) == 0).collect();
+        (mask, others)
+    });
+    let subs = filter_set(&config.filter_by_sub);
+    // Select on the parsed timestamps and borrow the entries; only the survivors of
+    // the cut get their strings cloned and formatted
+    let mut selected: Vec<(&ConfDeadlines, &ConfDeadline)> = Vec::new();
+
+    for item in confs {
+        if let Some((mask, others)) = &ranks {
+            let matched = if item.rank_bit != 0 { item.rank_bit & mask != 0 } else { others.contains(&item.rank.as_str()) };
+            if !matched { continue; }
+        }
+        if subs.as_ref().map_or(false, |s| !s.contains(item.sub.as_str())) { continue; }
+
+        for d in &item.deadlines {
+            if d.at >= now_ts || show_past {
+                selected.push((item, d));
             }
-            Err(e) => { println!("Error parsing Paper Deadlines YAML: {}", e); }
         }
-    });
+    }
+
+    // Only the earliest `limit` are shown: partition them out in linear time and sort just those.
+    // Ties are broken by title and year so the same input always yields the same list.
+    let order = |a: &(&ConfDeadlines, &ConfDeadline), b: &(&ConfDeadlines, &ConfDeadline)| {
+        (a.1.at, &a.0.title, &a.1.year).cmp(&(b.1.at, &b.0.title, &b.1.year))
+    };
+    let limit = config.max_deadlines.unwrap_or(50);
+    if selected.len() > limit {
+        selected.select_nth_unstable_by(limit, order);
+        selected.truncate(limit);
+    }
+    selected.sort_unstable_by(order);
+    selected.into_iter().map(|(item, d)| PaperDeadlineInfo {
+        title: item.title.clone(),
+        year: d.year.clone(),
+        deadline_utc: DateTime::from_timestamp(d.at, 0).map(|t| t.to_rfc3339()).unwrap_or_default(),
+        timezone: d.timezone.clone(),
+        rank: item.rank.clone(),
+        sub: item.sub.clone(),
+        place: d.place.clone(),
+        link: d.link.clone(),
+    }).collect()
+}
+
+// Filters the cached conferences and publishes the result. A few thousand in-memory
+// comparisons take well under a millisecond, so this runs inline on the caller.
+fn publish_deadlines(app: &AppHandle, state: &GlobalState, config: &PaperConfig, confs: &[ConfDeadlines]) {
+    let deadlines = filter_deadlines(confs, config, Utc::now());
+
+    // Hourly refreshes and unrelated config saves mostly reproduce the current list;
+    // only a different one is worth re-rendering every deadline view for
+    let changed = match state.deadlines.lock() {
+        Ok(mut state_deadlines) => {
+            let changed = *state_deadlines != deadlines;
+            if changed { *state_deadlines = deadlines.clone(); }
+            changed
+        }
+        Err(_) => true,
+    };
+
+    if changed && !deadlines.is_empty() {
+        let _ = app.emit("paper_update", &deadlines);
+    }
+}
+
+// Last successfully parsed download, so a restart can show deadlines without a fetch
+const PAPER_CACHE_FILE: &str = "paper_deadlines_cache.yml";
+
+// The cached conferences and the age of the download they came from
+fn read_deadline_cache(path: &Path) -> Option<(Vec<ConfDeadlines>, Duration)> {
+    // A modification time in the future (clock change) just counts as stale
+    let age = fs::metadata(path).ok()?.modified().ok()?.elapsed().unwrap_or(Duration::MAX);
+    let bytes = fs::read(path).ok()?;
+    Some((parse_conferences(&bytes).ok()?, age))
 }
 
 // --- Paper Deadline Polling Task ---
 async fn start_paper_monitor(app: AppHandle, state: Arc<GlobalState>) {
+    let cache_path = get_config_path(&app, PAPER_CACHE_FILE);
+    let mut primed = false;
+    // One client for the life of the task keeps the connection (and TLS session) alive
+    let client = reqwest::Client::builder()
+        .timeout(Duration::from_secs(30))
+        .build()
+        .unwrap_or_default();
+    // Validators of the download we hold; an unchanged file comes back as a bodiless 304
+    let mut etag: Option<String> = None;
+    let mut last_modified: Option<String> = None;
     loop {
         let app_config_path = get_config_path(&app, "app_config.json");
         let app_config_str = fs::read_to_string(&app_config_path).unwrap_or_default();
@@ -750,39 +1336,106 @@ async fn start_paper_monitor(app: AppHandle, state: Arc<GlobalState>) {
                 state_deadlines.clear();
             }
             let _ = app.emit("paper_update", Vec::<PaperDeadlineInfo>::new());
-            tokio::time::sleep(Duration::from_secs(5)).await;
+
+            // Nothing to do until it is switched back on, and only a save can do that,
+            // so wait for the save notification
+            loop {
+                state.paper_config_changed.notified().await;
+                let ac: AppConfig = load_config(&app_config_path).unwrap_or_default();
+                if ac.deadline_enabled.unwrap_or(true) { break; }
+            }
             continue;
         }
 
         let config_path = get_config_path(&app, "paper_deadline.json");
-        let config_str = fs::read_to_string(&config_path).unwrap_or_default();
-        let config: PaperConfig = serde_json::from_str(&config_str).unwrap_or(PaperConfig { 
+        let config: PaperConfig = load_config(&config_path).unwrap_or(PaperConfig { 
             update_interval: Some(3600), max_deadlines: Some(50), show_past_deadlines: Some(false), filter_by_rank: None, filter_by_sub: None, pinned_titles: None 
         });
 
-        // Use exact URL from Python code
-        let url = "https://ccfddl.github.io/conference/allconf.yml";
-        match reqwest::get(url).await {
-            Ok(res) => {
-                if let Ok(text) = res.text().await {
-                    println!("Fetched Paper Deadlines YAML ({} bytes)", text.len());
-                    {
-                        if let Ok(mut last) = state.last_yaml.lock() {
-                            *last = Some(text.clone());
+        let interval = Duration::from_secs(config.update_interval.unwrap_or(3600));
+        let mut fetched_at = None;
+
+        // First pass after startup: show the on-disk copy straight away, and skip the
+        // download entirely while it is younger than the update interval
+        if !primed {
+            primed = true;
+            let path = cache_path.clone();
+            if let Ok(Some((confs, age))) = tokio::task::spawn_blocking(move || read_deadline_cache(&path)).await {
+                let confs = Arc::new(confs);
+                if let Ok(mut cached) = state.conferences.lock() {
+                    *cached = Some(confs.clone());
+                }
+                publish_deadlines(&app, &state, &config, &confs);
+                if age < interval {
+                    fetched_at = tokio::time::Instant::now().checked_sub(age);
+                }
+            }
+        }
+
+        if fetched_at.is_none() {
+            // Use exact URL from Python code
+            let url = "https://ccfddl.github.io/conference/allconf.yml";
+            let mut req = client.get(url);
+            if let Some(v) = &etag { req = req.header(reqwest::header::IF_NONE_MATCH, v); }
+            if let Some(v) = &last_modified { req = req.header(reqwest::header::IF_MODIFIED_SINCE, v); }
+            match req.send().await {
+                Ok(res) if res.status() == reqwest::StatusCode::NOT_MODIFIED => {
+                    // Still current: restart the on-disk copy's clock and refilter what we
+                    // hold, which drops deadlines that have passed and restores the list
+                    // after the tracker was switched off and on again
+                    let _ = fs::File::options().write(true).open(&cache_path)
+                        .and_then(|f| f.set_modified(std::time::SystemTime::now()));
+                    let confs = state.conferences.lock().ok().and_then(|c| c.clone());
+                    if let Some(confs) = confs {
+                        publish_deadlines(&app, &state, &config, &confs);
+                    }
+                }
+                Ok(res) => {
+                    let header = |name: reqwest::header::HeaderName| res.headers().get(name).and_then(|v| v.to_str().ok()).map(str::to_string);
+                    let (new_etag, new_last_modified) = (header(reqwest::header::ETAG), header(reqwest::header::LAST_MODIFIED));
+                    if let Ok(body) = res.bytes().await {
+                        println!("Fetched Paper Deadlines YAML ({} bytes)", body.len());
+                        // Parse (and date-convert) once; config changes refilter the cached result.
+                        // Only a download that parsed is persisted for the next start.
+                        let path = cache_path.clone();
+                        let parsed = tokio::task::spawn_blocking(move || {
+                            let confs = parse_conferences(&body)?;
+                            let _ = fs::write(&path, &body);
+                            Ok::<_, serde_yaml::Error>(confs)
+                        }).await;
+                        match parsed {
+                            Ok(Ok(confs)) => {
+                                let confs = Arc::new(confs);
+                                if let Ok(mut cached) = state.conferences.lock() {
+                                    *cached = Some(confs.clone());
+                                }
+                                publish_deadlines(&app, &state, &config, &confs);
+                                etag = new_etag;
+                                last_modified = new_last_modified;
+                            }
+                            Ok(Err(e)) => { println!("Error parsing Paper Deadlines YAML: {}", e); }
+                            Err(_) => {}
                         }
                     }
-                    process_deadlines(app.clone(), state.clone(), config.clone(), text);
                 }
+                Err(e) => { println!("Error fetching paper deadlines: {}", e); }
             }
-            Err(e) => { println!("Error fetching paper deadlines: {}", e); }
         }
 
-        let interval = config.update_interval.unwrap_or(3600);
-        for _ in 0..interval {
-            let config_str = fs::read_to_string(&app_config_path).unwrap_or_default();
-            let ac: AppConfig = serde_json::from_str(&config_str).unwrap_or_default();
+        // Sleep until the next refresh. Saves wake us to stop early when the tracker is switched off, or to reschedule
+        // against a changed update_interval.
+        let fetched_at = fetched_at.unwrap_or_else(tokio::time::Instant::now);
+        let mut deadline = fetched_at + interval;
+        loop {
+            tokio::select! {
+                _ = state.paper_config_changed.notified() => {}
+                _ = tokio::time::sleep_until(deadline) => break,
+            }
+            let ac: AppConfig = load_config(&app_config_path).unwrap_or_default();
             if !ac.deadline_enabled.unwrap_or(true) { break; }
-            tokio::time::sleep(Duration::from_secs(1)).await;
+            if let Some(pc) = load_config::<PaperConfig>(&config_path) {
+                deadline = fetched_at + Duration::from_secs(pc.update_interval.unwrap_or(3600));
+            }
         }
     }
 }
@@ -790,35 +1443,32 @@ async fn start_paper_monitor(app: AppHandle, state: Arc<GlobalState>) {
 // --- Commands ---
 
 #[tauri::command]
-async fn save_gpu_config(app: AppHandle, config: GpuConfig) -> Result<(), String> {
+async fn save_gpu_config(app: AppHandle, state: tauri::State<'_, Arc<GlobalState>>, config: GpuConfig) -> Result<(), String> {
     let path = get_config_path(&app, "gpu_monitor.json");
     let content = serde_json::to_string_pretty(&config).map_err(|e| e.to_string())?;
-    fs::write(path, content).map_err(|e| e.to_string())?;
+    // An unchanged config would only make every worker reconcile for nothing
+    if !write_config(&path, &content)? { return Ok(()); }
+    state.gpu_config_changed.notify_one();
     Ok(())
 }
 
 #[tauri::command]
-async fn save_paper_config(app: AppHandle, state: tauri::State<'_, GlobalState>, config: PaperConfig) -> Result<(), String> {
+async fn save_paper_config(app: AppHandle, state: tauri::State<'_, Arc<GlobalState>>, config: PaperConfig) -> Result<(), String> {
     let path = get_config_path(&app, "paper_deadline.json");
     let content = serde_json::to_string_pretty(&config).map_err(|e| e.to_string())?;
-    fs::write(path, content).map_err(|e| e.to_string())?;
+    // Same filters as before: the published list and the fetch schedule stand
+    if !write_config(&path, &content)? { return Ok(()); }
 
-    // Trigger immediate UI refresh if we have cached YAML
-    let yaml = {
-        let last = state.last_yaml.lock().map_err(|e| e.to_string())?;
-        last.clone()
+    // Trigger immediate UI refresh if we have parsed deadlines cached
+    let confs = {
+        let cached = state.conferences.lock().map_err(|e| e.to_string())?;
+        cached.clone()
     };
-    if let Some(text) = yaml {
-        let state_arc = Arc::new(GlobalState {
-            deadlines: state.deadlines.clone(),
-            gpu_data: state.gpu_data.clone(),
-            last_yaml: state.last_yaml.clone(),
-            active_monitors: state.active_monitors.clone(),
-            active_workers: state.active_workers.clone(),
-            arxiv_papers: state.arxiv_papers.clone(),
-        });
-        process_deadlines(app, state_arc, config, text);
+    if let Some(confs) = confs {
+        publish_deadlines(&app, &state, &config, &confs);
     }
+    // Lets the fetch loop pick up a new update_interval
+    state.paper_config_changed.notify_one();
     Ok(())
 }
 
@@ -826,6 +1476,8 @@ async fn save_paper_config(app: AppHandle, state: tauri::State<'_, GlobalState>,
 async fn get_gpu_config(app: AppHandle) -> Result<GpuConfig, String> {
     let path = get_config_path(&app, "gpu_monitor.json");
     if !path.exists() { return Ok(GpuConfig::default()); }
+    if let Some(config) = load_config(&path) { return Ok(config); }
+    // Unreadable or malformed: re-read only to report why
     let config_str = fs::read_to_string(path).map_err(|e| e.to_string())?;
     serde_json::from_str(&config_str).map_err(|e| e.to_string())
 }
@@ -838,15 +1490,21 @@ async fn get_paper_config(app: AppHandle) -> Result<PaperConfig, String> {
             update_interval: Some(3600), max_deadlines: Some(50), show_past_deadlines: Some(false), filter_by_rank: None, filter_by_sub: None, pinned_titles: None 
         }); 
     }
+    if let Some(config) = load_config(&path) { return Ok(config); }
+    // Unreadable or malformed: re-read only to report why
     let config_str = fs::read_to_string(path).map_err(|e| e.to_string())?;
     serde_json::from_str(&config_str).map_err(|e| e.to_string())
 }
 
 #[tauri::command]
-async fn save_app_config(app: AppHandle, config: AppConfig) -> Result<(), String> {
+async fn save_app_config(app: AppHandle, state: tauri::State<'_, Arc<GlobalState>>, config: AppConfig) -> Result<(), String> {
     let path = get_config_path(&app, "app_config.json");
     let content = serde_json::to_string_pretty(&config).map_err(|e| e.to_string())?;
-    fs::write(path, content).map_err(|e| e.to_string())?;
+    write_config(&path, &content)?;
+    // The GPU, deadline and arXiv master switches live here
+    state.gpu_config_changed.notify_one();
+    state.arxiv_config_changed.notify_one();
+    state.paper_config_changed.notify_one();
     Ok(())
 }
 
@@ -864,18 +1522,20 @@ async fn get_app_config(app: AppHandle) -> Result<AppConfig, String> {
             hide_on_startup: Some(false),
         }); 
     }
+    if let Some(config) = load_config(&path) { return Ok(config); }
+    // Unreadable or malformed: re-read only to report why
     let config_str = fs::read_to_string(path).map_err(|e| e.to_string())?;
     serde_json::from_str(&config_str).map_err(|e| e.to_string())
 }
 
 #[tauri::command]
-async fn get_deadlines(state: tauri::State<'_, GlobalState>) -> Result<Vec<PaperDeadlineInfo>, String> {
+async fn get_deadlines(state: tauri::State<'_, Arc<GlobalState>>) -> Result<Vec<PaperDeadlineInfo>, String> {
     let deadlines = state.deadlines.lock().map_err(|e| e.to_string())?;
     Ok(deadlines.clone())
 }
 
 #[tauri::command]
-async fn get_gpu_data(state: tauri::State<'_, GlobalState>) -> Result<Vec<ServerGpuData>, String> {
+async fn get_gpu_data(state: tauri::State<'_, Arc<GlobalState>>) -> Result<Vec<ServerGpuData>, String> {
     let gpu_data = state.gpu_data.lock().map_err(|e| e.to_string())?;
     Ok(gpu_data.values().cloned().collect())
 }
@@ -1080,7 +1740,7 @@ async fn get_theme_config(app: AppHandle) -> Result<WidgetThemeConfig, String> {
                 migrated.assignments.insert("widget-arxiv-default".into(), "theme-arxiv-default".into());
             }
 
-            let _ = fs::write(&path, serde_json::to_string_pretty(&migrated).unwrap());
+            let _ = write_config(&path, &serde_json::to_string_pretty(&migrated).unwrap());
             Ok(migrated)
         }
     }
@@ -1090,7 +1750,7 @@ async fn get_theme_config(app: AppHandle) -> Result<WidgetThemeConfig, String> {
 async fn save_theme_config(app: AppHandle, config: WidgetThemeConfig) -> Result<(), String> {
     let path = get_config_path(&app, "widget_themes.json");
     let content = serde_json::to_string_pretty(&config).map_err(|e| e.to_string())?;
-    fs::write(path, content).map_err(|e| e.to_string())?;
+    write_config(&path, &content)?;
     Ok(())
 }
 
@@ -1334,11 +1994,15 @@ async fn start_arxiv_monitor(app: AppHandle, state: Arc<GlobalState>) {
             }
             let _ = app.emit("arxiv_update", Vec::<ArxivPaper>::new());
             
-            for _ in 0..interval {
-                let ac_str = fs::read_to_string(&app_config_path).unwrap_or_default();
-                let ac: AppConfig = serde_json::from_str(&ac_str).unwrap_or_default();
+            // Sleep until re-enabled; the save commands wake us, the interval is a fallback
+            let deadline = tokio::time::Instant::now() + Duration::from_secs(interval);
+            loop {
+                tokio::select! {
+                    _ = state.arxiv_config_changed.notified() => {}
+                    _ = tokio::time::sleep_until(deadline) => break,
+                }
+                let ac: AppConfig = load_config(&app_config_path).unwrap_or_default();
                 if ac.arxiv_enabled.unwrap_or(true) { break; }
-                tokio::time::sleep(Duration::from_secs(1)).await;
             }
             continue;
         }
@@ -1379,7 +2043,6 @@ async fn start_arxiv_monitor(app: AppHandle, state: Arc<GlobalState>) {
                     let mut current_tag = String::new();
                     let mut in_author = false;
 
-                    use quick_xml::events::Event;
                     loop {
                         match reader.read_event_into(&mut buf) {
                             Err(e) => { println!("Error parsing arxiv XML: {}", e); break; },
@@ -1493,25 +2156,30 @@ async fn start_arxiv_monitor(app: AppHandle, state: Arc<GlobalState>) {
             }
         }
 
-        let mut last_config_str = fs::read_to_string(&config_path).unwrap_or_default();
-        for _ in 0..interval {
-            let ac_str = fs::read_to_string(&app_config_path).unwrap_or_default();
-            let ac: AppConfig = serde_json::from_str(&ac_str).unwrap_or_default();
+        // Wait out the interval, but refetch early if the feed is switched off or its
+        // keywords/categories change. Saves of unrelated settings just resume the wait.
+        let last_config_str = fs::read_to_string(&config_path).unwrap_or_default();
+        let deadline = tokio::time::Instant::now() + Duration::from_secs(interval);
+        loop {
+            tokio::select! {
+                _ = state.arxiv_config_changed.notified() => {}
+                _ = tokio::time::sleep_until(deadline) => break,
+            }
+            let ac: AppConfig = load_config(&app_config_path).unwrap_or_default();
             if !ac.arxiv_enabled.unwrap_or(true) { break; }
-            
+
             let current_config_str = fs::read_to_string(&config_path).unwrap_or_default();
             if current_config_str != last_config_str { break; }
-
-            tokio::time::sleep(Duration::from_secs(1)).await;
         }
     }
 }
 
 #[tauri::command]
-async fn save_arxiv_config(app: AppHandle, config: ArxivConfig) -> Result<(), String> {
+async fn save_arxiv_config(app: AppHandle, state: tauri::State<'_, Arc<GlobalState>>, config: ArxivConfig) -> Result<(), String> {
     let path = get_config_path(&app, "arxiv_config.json");
     let content = serde_json::to_string_pretty(&config).map_err(|e| e.to_string())?;
-    fs::write(path, content).map_err(|e| e.to_string())?;
+    write_config(&path, &content)?;
+    state.arxiv_config_changed.notify_one();
     Ok(())
 }
 
@@ -1526,18 +2194,20 @@ async fn get_arxiv_config(app: AppHandle) -> Result<ArxivConfig, String> {
             show_card_hints: Some(true),
         }); 
     }
+    if let Some(config) = load_config(&path) { return Ok(config); }
+    // Unreadable or malformed: re-read only to report why
     let config_str = fs::read_to_string(path).map_err(|e| e.to_string())?;
     serde_json::from_str(&config_str).map_err(|e| e.to_string())
 }
 
 #[tauri::command]
-async fn get_arxiv_papers(state: tauri::State<'_, GlobalState>) -> Result<Vec<ArxivPaper>, String> {
+async fn get_arxiv_papers(state: tauri::State<'_, Arc<GlobalState>>) -> Result<Vec<ArxivPaper>, String> {
     let papers = state.arxiv_papers.lock().map_err(|e| e.to_string())?;
     Ok(papers.clone())
 }
 
 #[tauri::command]
-async fn mark_arxiv_seen(app: AppHandle, state: tauri::State<'_, GlobalState>, id: String, saved: bool) -> Result<(), String> {
+async fn mark_arxiv_seen(app: AppHandle, state: tauri::State<'_, Arc<GlobalState>>, id: String, saved: bool) -> Result<(), String> {
     let seen_path = get_config_path(&app, "arxiv_seen.json");
     let mut seen: Vec<String> = fs::read_to_string(&seen_path)
         .ok()
@@ -1546,7 +2216,7 @@ async fn mark_arxiv_seen(app: AppHandle, state: tauri::State<'_, GlobalState>, i
     
     if !seen.contains(&id) {
         seen.push(id.clone());
-        let _ = fs::write(&seen_path, serde_json::to_string_pretty(&seen).unwrap_or_default());
+        let _ = write_config(&seen_path, &serde_json::to_string_pretty(&seen).unwrap_or_default());
     }
 
     if saved {
@@ -1566,7 +2236,7 @@ async fn mark_arxiv_seen(app: AppHandle, state: tauri::State<'_, GlobalState>, i
                 .unwrap_or_default();
             
             saved_papers.push(p.clone());
-            let _ = fs::write(&saved_path, serde_json::to_string_pretty(&saved_papers).unwrap_or_default());
+            let _ = write_config(&saved_path, &serde_json::to_string_pretty(&saved_papers).unwrap_or_default());
         }
     } else {
         let mut paper_to_discard = None;
@@ -1584,7 +2254,7 @@ async fn mark_arxiv_seen(app: AppHandle, state: tauri::State<'_, GlobalState>, i
                 .and_then(|s| serde_json::from_str(&s).ok())
                 .unwrap_or_default();
             discarded.push(p);
-            let _ = fs::write(&discard_path, serde_json::to_string_pretty(&discarded).unwrap_or_default());
+            let _ = write_config(&discard_path, &serde_json::to_string_pretty(&discarded).unwrap_or_default());
         }
 
         if let Ok(papers) = state.arxiv_papers.lock() {
@@ -1622,7 +2292,7 @@ async fn remove_arxiv_saved_paper(app: AppHandle, id: String) -> Result<(), Stri
         .unwrap_or_default();
     
     saved_papers.retain(|p| p.id != id);
-    let _ = fs::write(&saved_path, serde_json::to_string_pretty(&saved_papers).unwrap_or_default());
+    let _ = write_config(&saved_path, &serde_json::to_string_pretty(&saved_papers).unwrap_or_default());
     let _ = app.emit("arxiv_saved_update", ());
     Ok(())
 }
@@ -1646,7 +2316,7 @@ async fn remove_arxiv_discarded_paper(app: AppHandle, id: String) -> Result<(),
         .unwrap_or_default();
     
     papers.retain(|p| p.id != id);
-    let _ = fs::write(&path, serde_json::to_string_pretty(&papers).unwrap_or_default());
+    let _ = write_config(&path, &serde_json::to_string_pretty(&papers).unwrap_or_default());
     let _ = app.emit("arxiv_discarded_update", ());
     Ok(())
 }
@@ -1692,19 +2362,17 @@ pub fn run() {
             let state = Arc::new(GlobalState {
                 deadlines: Arc::new(std::sync::Mutex::new(Vec::new())),
                 gpu_data: Arc::new(std::sync::Mutex::new(HashMap::new())),
-                last_yaml: Arc::new(std::sync::Mutex::new(None)),
+                gpu_emitted: Arc::new(std::sync::Mutex::new(HashMap::new())),
+                conferences: Arc::new(std::sync::Mutex::new(None)),
                 active_monitors: Arc::new(std::sync::Mutex::new(HashMap::new())),
                 active_workers: Arc::new(std::sync::Mutex::new(HashMap::new())),
                 arxiv_papers: Arc::new(std::sync::Mutex::new(Vec::new())),
+                gpu_config_changed: Arc::new(tokio::sync::Notify::new()),
+                arxiv_config_changed: Arc::new(tokio::sync::Notify::new()),
+                paper_config_changed: Arc::new(tokio::sync::Notify::new()),
             });
-            app.manage(GlobalState {
-                deadlines: state.deadlines.clone(),
-                gpu_data: state.gpu_data.clone(),
-                last_yaml: state.last_yaml.clone(),
-                active_monitors: state.active_monitors.clone(),
-                active_workers: state.active_workers.clone(),
-                arxiv_papers: state.arxiv_papers.clone(),
-            });
+            // Commands share the same Arc as the background tasks
+            app.manage(state.clone());
             
             // Tray
             let _tray = TrayIconBuilder::new()
@@ -1803,3 +2471,45 @@ pub fn run() {
         .run(tauri::generate_context!())
         .expect("error while running tauri application");
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    // Feeds rows with the given GPU indices and returns the size of each emitted sample
+    fn batch_sizes(indices: &[u32]) -> Vec<usize> {
+        let mut batcher = SmiStreamBatcher::default();
+        indices.iter()
+            .filter_map(|i| batcher.push(&format!("{}, NVIDIA A100, 100, 40960, 5, 30, 60.5", i)))
+            .map(|sample| sample.len())
+            .collect()
+    }
+
+    #[test]
+    fn tz_offset_rejects_out_of_range_offsets() {
+        assert_eq!(tz_offset("UTC+8"), FixedOffset::east_opt(8 * 3600));
+        assert_eq!(tz_offset("UTC-5:30"), FixedOffset::west_opt(5 * 3600 + 30 * 60));
+        assert_eq!(tz_offset("AoE"), FixedOffset::west_opt(12 * 3600));
+        assert_eq!(tz_offset("UTC+9999999"), None);
+        assert_eq!(tz_offset("UTC+15"), None);
+        assert_eq!(tz_offset("UTC+1:75"), None);
+    }
+
+    #[test]
+    fn batcher_follows_a_shrinking_gpu_set() {
+        assert_eq!(batch_sizes(&[0, 1, 2, 3, 0, 1, 2, 3, 0, 1, 2, 0, 1, 2, 0, 1, 2]), vec![4, 3, 3]);
+    }
+
+    #[test]
+    fn batcher_follows_a_growing_gpu_set() {
+        // The first three-GPU sample is cut short once, then full samples follow
+        assert_eq!(batch_sizes(&[0, 1, 0, 1, 0, 1, 2, 0, 1, 2, 0, 1, 2]), vec![2, 2, 3]);
+    }
+
+    #[test]
+    fn batcher_resyncs_after_a_short_sample() {
+        // One sample loses its last row; single-row samples must never follow
+        let sizes = batch_sizes(&[0, 1, 2, 3, 0, 1, 2, 3, 0, 1, 2, 0, 1, 2, 3, 0, 1, 2, 3, 0, 1, 2, 3, 0, 1, 2, 3]);
+        assert_eq!(sizes, vec![4, 3, 4, 4]);
+    }
+}
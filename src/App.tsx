@@ -1,4 +1,4 @@
-import { useState, useEffect } from "react";
+import { useState, useEffect, useMemo, useRef, useCallback, memo, type CSSProperties } from "react";
 import {
   LayoutDashboard,
   Settings,
@@ -67,6 +67,114 @@ const hexToRgba = (hex: string, opacity: number) => {
   return `rgba(${r}, ${g}, ${b}, ${opacity})`;
 };
 
+// GPUs of one host bucketed by Slurm job ("SYSTEM" for GPUs outside any job), in a
+// single pass. Cached per gpu_list array: the list is replaced, never mutated, on each
+// update, so the dashboard and widget regroup a host only when it has new data.
+const jobGroupCache = new WeakMap<any[], [string, any[]][]>();
+const groupGpusByJob = (gpuList: any[]): [string, any[]][] => {
+  let entries = jobGroupCache.get(gpuList);
+  if (!entries) {
+    const groups: Record<string, any[]> = {};
+    for (const gpu of gpuList) {
+      const gid = gpu.job_id || "SYSTEM";
+      if (!groups[gid]) groups[gid] = [];
+      groups[gid].push(gpu);
+    }
+    entries = Object.entries(groups);
+    jobGroupCache.set(gpuList, entries);
+  }
+  return entries;
+};
+
+// Collects gpu_update payloads and applies them as one state update per animation frame,
+// so a burst of per-host events (every sampler reporting in the same tick) renders once.
+// Hosts without a new payload keep their object identity.
+const batchGpuUpdates = (setData: (update: (prev: any[]) => any[]) => void) => {
+  let pending = new Map<string, any>();
+  let frame = 0;
+  const flush = () => {
+    frame = 0;
+    const batch = pending;
+    pending = new Map();
+    setData(prev => {
+      const next = prev.map(s => batch.get(s.host) ?? s);
+      batch.forEach((item, host) => {
+        if (!prev.some(s => s.host === host)) next.push(item);
+      });
+      return next;
+    });
+  };
+  return {
+    push: (item: any) => {
+      pending.set(item.host, item);
+      if (!frame) frame = requestAnimationFrame(flush);
+    },
+    remove: (host: string) => {
+      pending.delete(host);
+      setData(prev => prev.filter(s => s.host !== host));
+    },
+    cancel: () => {
+      if (frame) cancelAnimationFrame(frame);
+      frame = 0;
+      pending.clear();
+    },
+  };
+};
+
+// Labels of the widget windows currently shown. The visibility queries are separate
+// IPC round trips, so issue them together instead of one after another.
+const visibleWidgetLabels = async () => {
+  const widgets = (await getAllWebviewWindows()).filter(w => w.label.startsWith("widget-"));
+  const visible = await Promise.all(widgets.map(w => w.isVisible()));
+  return widgets.filter((_, i) => visible[i]).map(w => w.label);
+};
+
+// Teardown callbacks (unlisteners, timers) of an effect that sets things up after an
+// await. One added after the effect was cleaned up runs at once rather than leaving
+// its listener or timer attached (and holding its setters) for the window's lifetime.
+const listenerScope = () => {
+  let disposed = false;
+  const fns: (() => void)[] = [];
+  return {
+    add(f: () => void) {
+      if (disposed) f();
+      else fns.push(f);
+    },
+    dispose() {
+      disposed = true;
+      fns.splice(0).forEach(f => f());
+    },
+  };
+};
+
+// Debounced save for editors whose inputs fire on every click or drag step. The
+// returned function restarts the wait; once input settles (or the editor unmounts)
+// the last config goes to the latest onSave.
+function useDebouncedSave<T>(onSave: (config: T) => void, ms: number) {
+  const pending = useRef<{ timer: ReturnType<typeof setTimeout>, config: T } | null>(null);
+  const onSaveRef = useRef(onSave);
+  onSaveRef.current = onSave;
+
+  const flush = () => {
+    const current = pending.current;
+    if (!current) return;
+    clearTimeout(current.timer);
+    pending.current = null;
+    onSaveRef.current(current.config);
+  };
+
+  useEffect(() => flush, []);
+
+  return (config: T) => {
+    if (pending.current) clearTimeout(pending.current.timer);
+    pending.current = { timer: setTimeout(flush, ms), config };
+  };
+}
+
+// Dashboard deadline dates, shown in UTC to match their "Deadline (UTC)" label. One
+// formatter shared by every row.
+const deadlineDateFormat = new Intl.DateTimeFormat(undefined, { timeZone: "UTC" });
+
 // App Component
 const appWindow = getCurrentWindow();
 
@@ -98,37 +206,36 @@ function App() {
   const [themeConfig, setThemeConfig] = useState<WidgetThemeConfig>({ themes: [], assignments: {} });
   const [currentTheme, setCurrentTheme] = useState<WidgetTheme | null>(null);
 
+  // Dashboard GPU counters in one pass, recomputed only when GPU data changes
+  const gpuStats = useMemo(() => {
+    let online = 0, gpus = 0;
+    for (const s of gpuData) {
+      if (s.is_online) online++;
+      gpus += s.gpu_list.length;
+    }
+    return { online, gpus };
+  }, [gpuData]);
+
+  // Pin lookups for the deadline rows; rebuilt only when the pinned list changes
+  const pinnedTitles = useMemo(() => new Set<string>(paperConfig.pinned_titles || []), [paperConfig.pinned_titles]);
+
   useEffect(() => {
     const win = appWindow;
     setWindowLabel(win.label);
 
-    let interval: any;
-    let unlisteners: (() => void)[] = [];
+    const unlisteners = listenerScope();
 
     const init = async () => {
       try {
         console.log("Initializing window:", win.label);
-        const gc = await invoke("get_gpu_config");
-        const pc = await invoke("get_paper_config");
-        const arc = await invoke("get_arxiv_config");
+        const label = win.label;
         const ac = await invoke("get_app_config") as any;
-        const initialDeadlines: any = await invoke("get_deadlines");
-        const initialGpuData: any = await invoke("get_gpu_data");
-        const initialArxiv: any = await invoke("get_arxiv_papers");
         const tc: WidgetThemeConfig = await invoke("get_theme_config");
 
-        setGpuConfig(gc);
-        setPaperConfig(pc);
-        setArxivConfig(arc);
         setAppConfig(ac);
         if (ac.theme) localStorage.setItem("widgitron-theme", ac.theme);
-        setDeadlines(initialDeadlines);
-        setGpuData(initialGpuData);
-        setArxivPapers(initialArxiv);
-        setIsAutostart(await isEnabled());
         setThemeConfig(tc);
 
-        const label = win.label;
         if (label.startsWith("widget-")) {
           const tid = tc.assignments?.[label];
           let defaultId = "theme-gpu-default";
@@ -146,7 +253,7 @@ function App() {
           setIsPinned(pinned);
           
           // Wait a bit for the window to be ready before Win32 manipulations
-          setTimeout(async () => {
+          const placement = setTimeout(async () => {
             if (pinned) {
               await win.setAlwaysOnTop(true);
               await invoke("set_desktop_mode", { label, enabled: false });
@@ -155,79 +262,98 @@ function App() {
               await invoke("set_desktop_mode", { label, enabled: true });
             }
           }, 500);
+          unlisteners.add(() => clearTimeout(placement));
         }
 
-        const windows = await getAllWebviewWindows();
-        const initialActive = [];
-        for (const w of windows) {
-          if (w.label.startsWith("widget-") && await w.isVisible()) {
-            initialActive.push(w.label);
-          }
-        }
-        setActiveWidgets(initialActive);
-
-        interval = setInterval(async () => {
-          const wins = await getAllWebviewWindows();
-          const active = [];
-          for (const w of wins) {
-            if (w.label.startsWith("widget-") && await w.isVisible()) {
-              active.push(w.label);
-            }
+        const u5 = await listen("theme_update", (event: any) => {
+          const config = event.payload as WidgetThemeConfig;
+          setThemeConfig(config);
+          if (label.startsWith("widget-")) {
+            const tid = config.assignments?.[label];
+            const defaultId = label.includes("gpu") ? "theme-gpu-default" : "theme-deadline-default";
+            const theme = config.themes.find(t => t.id === tid) || config.themes.find(t => t.id === defaultId);
+            setCurrentTheme(theme || null);
           }
-          setActiveWidgets(active);
+        });
+        unlisteners.add(() => u5());
+
+        // Widget contents subscribe to their own feed; only the dashboard needs every stream
+        if (label !== "main") return;
+
+        const gc = await invoke("get_gpu_config");
+        const pc = await invoke("get_paper_config");
+        const arc = await invoke("get_arxiv_config");
+        const initialDeadlines: any = await invoke("get_deadlines");
+        const initialGpuData: any = await invoke("get_gpu_data");
+        const initialArxiv: any = await invoke("get_arxiv_papers");
+
+        setGpuConfig(gc);
+        setPaperConfig(pc);
+        setArxivConfig(arc);
+        setDeadlines(initialDeadlines);
+        setGpuData(initialGpuData);
+        setArxivPapers(initialArxiv);
+        setIsAutostart(await isEnabled());
+
+        setActiveWidgets(await visibleWidgetLabels());
+
+        // Registered with the scope like the listeners, so a poll started after the
+        // effect was cleaned up (StrictMode's first mount) is cleared straight away
+        const poll = setInterval(async () => {
+          const next = await visibleWidgetLabels();
+          // Keep the previous array when nothing changed, so the poll doesn't re-render the dashboard every second
+          setActiveWidgets(prev => prev.length === next.length && prev.every((l, i) => l === next[i]) ? prev : next);
         }, 1000);
+        unlisteners.add(() => clearInterval(poll));
 
+        // A drag-resize fires a burst of events; keep a single isMaximized round trip in
+        // flight and query once more afterwards if further resizes arrived meanwhile
+        let querying = false;
+        let stale = false;
         const u1 = await win.onResized(async () => {
-          const maximized = await win.isMaximized();
-          setIsMaximized(maximized);
-        });
-        unlisteners.push(() => u1());
-
-        const u2 = await listen<any>("gpu_update", (event) => {
-          const item = event.payload;
-          setGpuData(prev => {
-            const index = prev.findIndex(s => s.host === item.host);
-            if (index === -1) return [...prev, item];
-            const next = [...prev];
-            next[index] = item;
-            return next;
-          });
+          if (querying) { stale = true; return; }
+          querying = true;
+          try {
+            do {
+              stale = false;
+              setIsMaximized(await win.isMaximized());
+            } while (stale);
+          } finally {
+            querying = false;
+          }
         });
-        unlisteners.push(() => u2());
+        unlisteners.add(() => u1());
+
+        const gpuBatch = batchGpuUpdates(setGpuData);
+        const u2 = await listen<any>("gpu_update", (event) => gpuBatch.push(event.payload));
+        unlisteners.add(() => { u2(); gpuBatch.cancel(); });
 
         const u3 = await listen<any[]>("paper_update", (event) => {
           setDeadlines(event.payload);
         });
-        unlisteners.push(() => u3());
+        unlisteners.add(() => u3());
 
         const u4 = await listen("gpu_clear", () => {
+          gpuBatch.cancel();
           setGpuData([]);
         });
-        unlisteners.push(() => u4());
+        unlisteners.add(() => u4());
+
+        const u7 = await listen<string>("gpu_remove", (event) => gpuBatch.remove(event.payload));
+        unlisteners.add(() => u7());
 
-        const u5 = await listen("theme_update", (event: any) => {
-          const config = event.payload as WidgetThemeConfig;
-          setThemeConfig(config);
-          if (label.startsWith("widget-")) {
-            const tid = config.assignments?.[label];
-            const defaultId = label.includes("gpu") ? "theme-gpu-default" : "theme-deadline-default";
-            const theme = config.themes.find(t => t.id === tid) || config.themes.find(t => t.id === defaultId);
-            setCurrentTheme(theme || null);
-          }
-        });
-        unlisteners.push(() => u5());
         const u6 = await listen<any[]>("arxiv_update", (event) => setArxivPapers(event.payload));
-        unlisteners.push(() => u6());
+        unlisteners.add(() => u6());
 
         const u8 = await listen("arxiv_saved_update", async () => {
           setArxivSavedPapers(await invoke<any[]>("get_arxiv_saved_papers"));
         });
-        unlisteners.push(() => u8());
+        unlisteners.add(() => u8());
 
         const u9 = await listen("arxiv_discarded_update", async () => {
           setArxivDiscardedPapers(await invoke<any[]>("get_arxiv_discarded_papers"));
         });
-        unlisteners.push(() => u9());
+        unlisteners.add(() => u9());
 
         // Initial fetch
         invoke<any>("get_arxiv_config").then(setArxivConfig).catch(console.error);
@@ -239,18 +365,15 @@ function App() {
     };
 
     if (win.label === "tray-menu") {
+      // The tray menu is static; it needs no config or data
       win.onFocusChanged((event) => {
         if (!event.payload) win.hide();
-      }).then(u => unlisteners.push(() => u()));
-      init();
+      }).then(u => unlisteners.add(() => u()));
     } else {
       init();
     }
 
-    return () => {
-      if (interval) clearInterval(interval);
-      unlisteners.forEach(f => f());
-    };
+    return () => unlisteners.dispose();
   }, []);
 
   const saveGpuConfig = async (newConfig: any) => {
@@ -261,13 +384,22 @@ function App() {
   };
 
   const savePaperConfig = async (newConfig: any) => {
+    // Apply it here first so pins and filters respond at once; the write, refilter and
+    // broadcast follow, and a failed save puts the previous config back
+    const prevConfig = paperConfig;
+    setPaperConfig(newConfig);
     try {
       await invoke("save_paper_config", { config: newConfig });
-      setPaperConfig(newConfig);
       await emit("paper_config_update", newConfig);
-    } catch (e) { console.error("Save failed", e); }
+    } catch (e) {
+      setPaperConfig(prevConfig);
+      console.error("Save failed", e);
+    }
   };
 
+  // Stable handle for the memoised deadline rows; always runs the latest closure
+  const togglePinRef = useRef<(title: string) => void>(() => {});
+  const onTogglePin = useCallback((title: string) => togglePinRef.current(title), []);
   const togglePinConference = async (title: string) => {
     const nextPinned = (paperConfig.pinned_titles || []).includes(title)
       ? paperConfig.pinned_titles.filter((t: string) => t !== title)
@@ -275,6 +407,7 @@ function App() {
     const nextConfig = { ...paperConfig, pinned_titles: nextPinned };
     await savePaperConfig(nextConfig);
   };
+  togglePinRef.current = togglePinConference;
 
   const onSaveApp = async (config: any) => {
     setAppConfig(config);
@@ -364,12 +497,11 @@ function App() {
   const handleClose = async () => {
     console.log("Close clicked, label:", windowLabel);
     try {
-      const win = getCurrentWindow();
       if (windowLabel === "main" || windowLabel.startsWith("widget-")) {
-        await win.hide();
+        await appWindow.hide();
         // Notify main window if this was a widget (though events are better)
       } else {
-        await win.close();
+        await appWindow.close();
       }
     } catch (e) { console.error("Close failed", e); }
   };
@@ -379,7 +511,7 @@ function App() {
     if (e.button === 0 && !target.closest('[data-no-drag="true"]')) {
       try {
         console.log("Start dragging");
-        await getCurrentWindow().startDragging();
+        await appWindow.startDragging();
       } catch (e) { console.error("Drag failed", e); }
     }
   };
@@ -486,8 +618,8 @@ function App() {
           <AnimatePresence mode="wait">
             {activeTab === "dashboard" && (
               <motion.div key="dashboard" initial={{ opacity: 0, x: 20 }} animate={{ opacity: 1, x: 0 }} exit={{ opacity: 0, x: -20 }} className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
-                <StatCard label="Active Monitors" value={gpuData.filter(s => s.is_online).length.toString()} icon={<Server className="text-blue-400" />} theme={appConfig.theme} />
-                <StatCard label="Total GPUs" value={gpuData.reduce((acc, s) => acc + s.gpu_list.length, 0).toString()} icon={<Cpu className="text-purple-400" />} theme={appConfig.theme} />
+                <StatCard label="Active Monitors" value={gpuStats.online.toString()} icon={<Server className="text-blue-400" />} theme={appConfig.theme} />
+                <StatCard label="Total GPUs" value={gpuStats.gpus.toString()} icon={<Cpu className="text-purple-400" />} theme={appConfig.theme} />
                 <StatCard label="Active Deadlines" value={deadlines.length.toString()} icon={<Calendar className="text-emerald-400" />} theme={appConfig.theme} />
                 <StatCard label="Arxiv Radar" value={arxivPapers.length.toString()} icon={<Activity className="text-pink-400" />} theme={appConfig.theme} />
 
@@ -561,8 +693,8 @@ function App() {
                 <div className="space-y-6">
                   {gpuData.length === 0 ? (
                     <div className="p-12 text-center bg-black/5 rounded-3xl border border-dashed border-white/10 text-slate-500 font-bold uppercase tracking-widest text-xs">No active data. Configure servers in Settings.</div>
-                  ) : gpuData.map((server, idx) => (
-                    <div key={idx} className="glass-card p-6">
+                  ) : gpuData.map((server) => (
+                    <div key={server.host} className="glass-card p-6">
                       <div className="flex items-center justify-between mb-6">
                         <div className="flex items-center gap-3">
                           <div className={`w-3 h-3 rounded-full ${server.is_online ? "bg-emerald-500 shadow-[0_0_10px_#10b981]" : "bg-red-500"}`} />
@@ -571,58 +703,49 @@ function App() {
                         <span className="text-xs font-black text-slate-500 uppercase tracking-widest">{server.gpu_list.length} GPUs Detected</span>
                       </div>
                       <div className="space-y-8">
-                        {(() => {
-                          const groups: Record<string, any[]> = {};
-                          server.gpu_list.forEach((gpu: any) => {
-                            const gid = gpu.job_id || "SYSTEM";
-                            if (!groups[gid]) groups[gid] = [];
-                            groups[gid].push(gpu);
-                          });
-
-                          return Object.entries(groups).map(([jobId, gpus]) => (
-                            <div key={jobId} className="space-y-4">
-                              {jobId !== "SYSTEM" && (
-                                <div className="flex items-center gap-2 text-xs font-black text-blue-400 uppercase tracking-[0.2em] mb-2 px-1">
-                                  <Activity size={14} /> Job: {jobId}
-                                  <CopyButton text={jobId} />
-                                </div>
-                              )}
-                              <div className="grid grid-cols-1 lg:grid-cols-2 gap-4">
-                                {gpus.map((gpu, gidx) => (
-                                  <div key={gidx} className={`p-5 rounded-xl border ${appConfig.theme === "light" ? "bg-slate-50 border-slate-100" : "bg-black/20 border-white/5"} relative group transition-all hover:bg-black/5`}>
-                                    <div className="flex items-center justify-between mb-4">
-                                      <span className={`text-sm font-bold ${appConfig.theme === "light" ? "text-slate-900" : "text-white"}`}>{gpu.name}</span>
-                                      <span className={`text-[10px] font-black ${gpu.util > 80 ? "text-red-500" : "text-blue-400"} uppercase tracking-widest`}>{gpu.util}%</span>
-                                    </div>
+                        {groupGpusByJob(server.gpu_list).map(([jobId, gpus]) => (
+                          <div key={jobId} className="space-y-4">
+                            {jobId !== "SYSTEM" && (
+                              <div className="flex items-center gap-2 text-xs font-black text-blue-400 uppercase tracking-[0.2em] mb-2 px-1">
+                                <Activity size={14} /> Job: {jobId}
+                                <CopyButton text={jobId} />
+                              </div>
+                            )}
+                            <div className="grid grid-cols-1 lg:grid-cols-2 gap-4">
+                              {gpus.map((gpu, gidx) => (
+                                <div key={gidx} className={`p-5 rounded-xl border ${appConfig.theme === "light" ? "bg-slate-50 border-slate-100" : "bg-black/20 border-white/5"} relative group transition-all hover:bg-black/5`}>
+                                  <div className="flex items-center justify-between mb-4">
+                                    <span className={`text-sm font-bold ${appConfig.theme === "light" ? "text-slate-900" : "text-white"}`}>{gpu.name}</span>
+                                    <span className={`text-[10px] font-black ${gpu.util > 80 ? "text-red-500" : "text-blue-400"} uppercase tracking-widest`}>{gpu.util}%</span>
+                                  </div>
 
-                                    <div className="space-y-4">
-                                      <div>
-                                        <div className="flex justify-between text-[10px] text-slate-500 font-bold uppercase tracking-tighter mb-1">
-                                          <span>Load</span>
-                                          <span>{gpu.util}%</span>
-                                        </div>
-                                        <div className={`w-full ${appConfig.theme === "light" ? "bg-slate-200" : "bg-white/5"} h-1.5 rounded-full overflow-hidden mt-1`}>
-                                          <motion.div initial={{ width: 0 }} animate={{ width: `${gpu.util}%` }} className={`h-full rounded-full ${gpu.util > 80 ? "bg-red-500" : "bg-blue-500"}`} />
-                                        </div>
+                                  <div className="space-y-4">
+                                    <div>
+                                      <div className="flex justify-between text-[10px] text-slate-500 font-bold uppercase tracking-tighter mb-1">
+                                        <span>Load</span>
+                                        <span>{gpu.util}%</span>
                                       </div>
+                                      <div className={`w-full ${appConfig.theme === "light" ? "bg-slate-200" : "bg-white/5"} h-1.5 rounded-full overflow-hidden mt-1`}>
+                                        <div className={`h-full rounded-full transition-[width] duration-500 ${gpu.util > 80 ? "bg-red-500" : "bg-blue-500"}`} style={{ width: `${gpu.util}%` }} />
+                                      </div>
+                                    </div>
 
-                                      <div className="grid grid-cols-2 gap-4">
-                                        <div className={`p-2 rounded-lg ${appConfig.theme === "light" ? "bg-white" : "bg-white/5"}`}>
-                                          <div className="text-[10px] text-slate-500 font-bold uppercase tracking-tighter">Temp</div>
-                                          <div className={`text-sm font-bold ${appConfig.theme === "light" ? "text-slate-900" : "text-white"}`}>{gpu.temp}°C</div>
-                                        </div>
-                                        <div className={`p-2 rounded-lg ${appConfig.theme === "light" ? "bg-white" : "bg-white/5"}`}>
-                                          <div className="text-[10px] text-slate-500 font-bold uppercase tracking-tighter">Memory</div>
-                                          <div className={`text-sm font-bold ${appConfig.theme === "light" ? "text-slate-900" : "text-white"}`}>{gpu.mem_used}/{gpu.mem_total}MB</div>
-                                        </div>
+                                    <div className="grid grid-cols-2 gap-4">
+                                      <div className={`p-2 rounded-lg ${appConfig.theme === "light" ? "bg-white" : "bg-white/5"}`}>
+                                        <div className="text-[10px] text-slate-500 font-bold uppercase tracking-tighter">Temp</div>
+                                        <div className={`text-sm font-bold ${appConfig.theme === "light" ? "text-slate-900" : "text-white"}`}>{gpu.temp}°C</div>
+                                      </div>
+                                      <div className={`p-2 rounded-lg ${appConfig.theme === "light" ? "bg-white" : "bg-white/5"}`}>
+                                        <div className="text-[10px] text-slate-500 font-bold uppercase tracking-tighter">Memory</div>
+                                        <div className={`text-sm font-bold ${appConfig.theme === "light" ? "text-slate-900" : "text-white"}`}>{gpu.mem_used}/{gpu.mem_total}MB</div>
                                       </div>
                                     </div>
                                   </div>
-                                ))}
-                              </div>
+                                </div>
+                              ))}
                             </div>
-                          ));
-                        })()}
+                          </div>
+                        ))}
                       </div>
                       {server.error && <p className="mt-4 text-[10px] text-red-400/60 italic font-medium break-all">{server.error}</p>}
                     </div>
@@ -660,39 +783,15 @@ function App() {
                 <div className="space-y-4">
                   {deadlines.length === 0 ? (
                     <div className="p-12 text-center bg-black/5 rounded-3xl border border-dashed border-white/10 text-slate-500 font-bold uppercase tracking-widest text-xs">No deadlines match your current filters.</div>
-                  ) : deadlines.map((dl, idx) => {
-                    const isPinned = (paperConfig.pinned_titles || []).includes(dl.title);
-                    return (
-                      <div key={idx} className={`border border-[var(--dashboard-border)] rounded-2xl p-6 flex items-center justify-between hover:bg-black/5 transition-all group ${appConfig.theme === "light" ? "bg-white" : "bg-white/5"}`}>
-                        <div className="flex items-center gap-6">
-                          <div className={`w-16 h-16 rounded-2xl flex flex-col items-center justify-center relative ${appConfig.theme === "light" ? "bg-purple-100 text-purple-600" : "bg-gradient-to-br from-purple-500/20 to-pink-500/20 border border-purple-500/20 text-purple-400"}`}>
-                            <span className="text-[10px] font-black uppercase tracking-tighter opacity-60">{dl.sub}</span>
-                            <Trophy size={20} className={appConfig.theme === "light" ? "text-purple-600" : "text-purple-400"} />
-                            <button
-                              onClick={() => togglePinConference(dl.title)}
-                              className={`absolute -top-2 -right-2 p-1.5 rounded-full shadow-lg transition-all ${isPinned ? "bg-amber-500 text-white scale-110" : "bg-slate-800 text-slate-500 opacity-0 group-hover:opacity-100"}`}
-                            >
-                              <Pin size={10} className={isPinned ? "fill-current" : ""} />
-                            </button>
-                          </div>
-                          <div>
-                            <h3 className={`text-lg font-bold group-hover:text-purple-400 transition-colors ${appConfig.theme === "light" ? "text-slate-900" : "text-white"}`}>{dl.title} {dl.year}</h3>
-                            <div className="flex items-center gap-3 mt-1">
-                              <p className="text-xs text-slate-500 font-medium">{dl.place}</p>
-                              <div className="w-1 h-1 rounded-full bg-slate-700" />
-                              <div className="text-[10px] font-mono font-bold text-purple-500/80">
-                                <DeadlineCountdown date={dl.deadline_utc} />
-                              </div>
-                            </div>
-                          </div>
-                        </div>
-                        <div className="text-right">
-                          <div className={`text-xl font-black ${appConfig.theme === "light" ? "text-slate-900" : "text-white"}`}>{new Date(dl.deadline_utc).toLocaleDateString()}</div>
-                          <div className="text-xs font-bold text-slate-500 uppercase tracking-widest">Deadline (UTC)</div>
-                        </div>
-                      </div>
-                    );
-                  })}
+                  ) : deadlines.map((dl, idx) => (
+                    <DeadlineRow
+                      key={idx}
+                      dl={dl}
+                      isPinned={pinnedTitles.has(dl.title)}
+                      theme={appConfig.theme}
+                      onTogglePin={onTogglePin}
+                    />
+                  ))}
                 </div>
               </motion.div>
             )}
@@ -823,173 +922,281 @@ function App() {
 
 // --- SUB-COMPONENTS ---
 
+// One dashboard deadline. Memoised so App's frequent re-renders (GPU updates) only
+// reach rows whose deadline, pin state or theme actually changed.
+const DeadlineRow = memo(function DeadlineRow({ dl, isPinned, theme, onTogglePin }: { dl: any, isPinned: boolean, theme?: string, onTogglePin: (title: string) => void }) {
+  return (
+    <div className={`border border-[var(--dashboard-border)] rounded-2xl p-6 flex items-center justify-between hover:bg-black/5 transition-all group ${theme === "light" ? "bg-white" : "bg-white/5"}`}>
+      <div className="flex items-center gap-6">
+        <div className={`w-16 h-16 rounded-2xl flex flex-col items-center justify-center relative ${theme === "light" ? "bg-purple-100 text-purple-600" : "bg-gradient-to-br from-purple-500/20 to-pink-500/20 border border-purple-500/20 text-purple-400"}`}>
+          <span className="text-[10px] font-black uppercase tracking-tighter opacity-60">{dl.sub}</span>
+          <Trophy size={20} className={theme === "light" ? "text-purple-600" : "text-purple-400"} />
+          <button
+            onClick={() => onTogglePin(dl.title)}
+            className={`absolute -top-2 -right-2 p-1.5 rounded-full shadow-lg transition-all ${isPinned ? "bg-amber-500 text-white scale-110" : "bg-slate-800 text-slate-500 opacity-0 group-hover:opacity-100"}`}
+          >
+            <Pin size={10} className={isPinned ? "fill-current" : ""} />
+          </button>
+        </div>
+        <div>
+          <h3 className={`text-lg font-bold group-hover:text-purple-400 transition-colors ${theme === "light" ? "text-slate-900" : "text-white"}`}>{dl.title} {dl.year}</h3>
+          <div className="flex items-center gap-3 mt-1">
+            <p className="text-xs text-slate-500 font-medium">{dl.place}</p>
+            <div className="w-1 h-1 rounded-full bg-slate-700" />
+            <div className="text-[10px] font-mono font-bold text-purple-500/80">
+              <DeadlineCountdown date={dl.deadline_utc} />
+            </div>
+          </div>
+        </div>
+      </div>
+      <div className="text-right">
+        <div className={`text-xl font-black ${theme === "light" ? "text-slate-900" : "text-white"}`}>{deadlineDateFormat.format(Date.parse(dl.deadline_utc))}</div>
+        <div className="text-xs font-bold text-slate-500 uppercase tracking-widest">Deadline (UTC)</div>
+      </div>
+    </div>
+  );
+});
+
+// One shared 1 Hz clock for every countdown in the window.
+// It only runs while something is subscribed and the window is visible, and fires just
+// after each wall-clock second so the shown seconds roll over on time without drift.
+const countdownSubscribers = new Set<(now: number) => void>();
+let countdownTimer: ReturnType<typeof setTimeout> | undefined;
+
+function tickCountdowns() {
+  // One clock read per tick, shared by every countdown
+  const now = Date.now();
+  countdownSubscribers.forEach(f => f(now));
+}
+
+function scheduleCountdownTick() {
+  const timer = setTimeout(() => {
+    tickCountdowns();
+    // The tick may have expired the last countdown, which stops (or replaces) the clock
+    if (countdownTimer === timer) scheduleCountdownTick();
+  }, 1000 - (Date.now() % 1000));
+  countdownTimer = timer;
+}
+
+function syncCountdownTimer() {
+  if (document.hidden || countdownSubscribers.size === 0) {
+    clearTimeout(countdownTimer);
+    countdownTimer = undefined;
+  } else if (countdownTimer === undefined) {
+    // Coming back into view: catch up immediately rather than on the next tick. That
+    // tick may expire every countdown, or an unsubscribe during it may already have
+    // restarted the clock, so only schedule if still needed.
+    tickCountdowns();
+    if (countdownSubscribers.size > 0 && countdownTimer === undefined) scheduleCountdownTick();
+  }
+}
+document.addEventListener("visibilitychange", syncCountdownTimer);
+
+function subscribeCountdown(fn: (now: number) => void) {
+  countdownSubscribers.add(fn);
+  syncCountdownTimer();
+  return () => {
+    countdownSubscribers.delete(fn);
+    syncCountdownTimer();
+  };
+}
+
 function DeadlineCountdown({ date }: { date: string }) {
   const [timeLeft, setTimeLeft] = useState<string>("");
 
   useEffect(() => {
-    const calculate = () => {
-      const target = new Date(date).getTime();
-      const now = new Date().getTime();
+    // The target only changes with the prop, so it is parsed once per effect
+    const target = Date.parse(date);
+    let unsubscribe: (() => void) | undefined;
+    const calculate = (now: number) => {
       const diff = target - now;
 
       if (diff <= 0) {
+        // Nothing left to count down
         setTimeLeft("EXPIRED");
+        unsubscribe?.();
+        unsubscribe = undefined;
         return;
       }
 
-      const d = Math.floor(diff / (1000 * 60 * 60 * 24));
-      const h = Math.floor((diff % (1000 * 60 * 60 * 24)) / (1000 * 60 * 60));
-      const m = Math.floor((diff % (1000 * 60 * 60)) / (1000 * 60));
-      const s = Math.floor((diff % (1000 * 60)) / 1000);
+      // Whole seconds once, then exact integer carries up to days
+      let rest = Math.floor(diff / 1000);
+      const s = rest % 60;
+      rest = (rest - s) / 60;
+      const m = rest % 60;
+      rest = (rest - m) / 60;
+      const h = rest % 24;
+      const d = (rest - h) / 24;
 
       setTimeLeft(`${d}d ${h}h ${m}m ${s}s`);
     };
 
-    calculate();
-    const interval = setInterval(calculate, 1000);
-    return () => clearInterval(interval);
+    const now = Date.now();
+    calculate(now);
+    if (target > now) unsubscribe = subscribeCountdown(calculate);
+    return () => unsubscribe?.();
   }, [date]);
 
   return <span>{timeLeft}</span>;
 }
 
+// Theme colors of the GPU widget, published as CSS custom properties on its root so a
+// theme change restyles every tile through the cascade without re-rendering them
+const gpuColor = {
+  accent: "var(--gpu-accent)",
+  success: "var(--gpu-success)",
+  warning: "var(--gpu-warning)",
+  danger: "var(--gpu-danger)",
+  mainText: "var(--gpu-main-text)",
+  subText: "var(--gpu-sub-text)",
+};
+
+// One GPU tile. Props are all primitives, so on a host update only the tiles whose
+// readings actually changed re-render.
+const GpuCell = memo(function GpuCell({ index, util, memUsed, power }: { index: number, util: number, memUsed: number, power: number }) {
+  const usage = util / 100;
+  const usageColor = usage > 0.9 ? gpuColor.danger : (usage > 0.6 ? gpuColor.warning : gpuColor.accent);
+  return (
+    <div className="space-y-1 bg-white/5 p-1.5 rounded-lg border border-white/5 flex flex-col justify-center min-w-0">
+      <div className="flex justify-between items-center text-[8px] font-black tracking-tighter">
+        <span style={{ color: gpuColor.subText }}>#{index}</span>
+        <span style={{ color: usageColor }}>{util}%</span>
+      </div>
+      <div className="h-1 w-full bg-black/40 rounded-full overflow-hidden">
+        <div className="h-full rounded-full transition-[width] duration-500" style={{ width: `${util}%`, backgroundColor: usageColor }} />
+      </div>
+      <div className="flex justify-between items-center text-[7px] font-bold tracking-tighter tabular-nums" style={{ color: gpuColor.subText }}>
+        <span>{(memUsed / 1024).toFixed(0)}G</span>
+        <span>{power.toFixed(0)}W</span>
+      </div>
+    </div>
+  );
+});
+
+// One host's section of the GPU widget. gpu_update replaces only the updated host's
+// entry, so the other hosts keep their object identity and skip re-rendering.
+const GpuServerBlock = memo(function GpuServerBlock({ server }: { server: any }) {
+  const { accent, success, danger, mainText, subText } = gpuColor;
+  return (
+    <div className="space-y-4">
+      <div className="flex items-center justify-between border-l-2 border-white/10 pl-2">
+        <div className="flex flex-col items-start">
+          <span className="text-[10px] font-black uppercase tracking-tighter" style={{ color: mainText }}>{server.host}</span>
+          {server.last_update && <span className="text-[7px] opacity-40 font-mono">Last: {server.last_update}</span>}
+        </div>
+        {server.is_online ? (
+          <span className="text-[7px] font-black uppercase" style={{ color: success }}>Online</span>
+        ) : (
+          <span className="text-[7px] font-black uppercase" style={{ color: danger }}>Offline</span>
+        )}
+      </div>
+
+      {server.error && <div className="text-[9px] font-medium italic px-2" style={{ color: danger }}>{server.error}</div>}
+
+      <div className="space-y-3 pl-2">
+        {groupGpusByJob(server.gpu_list).map(([jobId, gpus]) => (
+          <div key={jobId} className="space-y-1.5">
+            {jobId !== "SYSTEM" && (
+              <div className="flex items-center gap-1 text-[8px] font-black uppercase tracking-widest pl-1 group/job" style={{ color: subText }}>
+                <Activity size={10} style={{ color: accent }} /> JOB: {jobId}
+                <div className="ml-1 flex items-center">
+                  <CopyButton text={jobId} />
+                </div>
+              </div>
+            )}
+            <div className="grid grid-cols-4 gap-1.5">
+              {gpus.map((gpu, i) => (
+                <GpuCell key={i} index={i} util={gpu.util} memUsed={gpu.mem_used} power={gpu.power || 0} />
+              ))}
+            </div>
+          </div>
+        ))}
+      </div>
+    </div>
+  );
+});
+
 function GPUWidgetContent() {
   const [serverData, setServerData] = useState<any[]>([]);
   const [currentTheme, setCurrentTheme] = useState<WidgetTheme | null>(null);
-  const win = getCurrentWindow();
 
   useEffect(() => {
-    let unlisteners: (() => void)[] = [];
+    const unlisteners = listenerScope();
 
     const load = async () => {
       try {
         setServerData(await invoke("get_gpu_data"));
         const config: WidgetThemeConfig = await invoke("get_theme_config");
-        const themeId = config.assignments?.[win.label];
+        const themeId = config.assignments?.[appWindow.label];
         const theme = config.themes.find(t => t.id === themeId) || config.themes.find(t => t.id === "theme-gpu-default");
         setCurrentTheme(theme || null);
 
-        const u1 = await listen<any>("gpu_update", (event) => {
-          const item = event.payload;
-          setServerData(prev => {
-            const index = prev.findIndex(s => s.host === item.host);
-            if (index === -1) return [...prev, item];
-            const next = [...prev];
-            next[index] = item;
-            return next;
-          });
-        });
-        unlisteners.push(() => u1());
+        const gpuBatch = batchGpuUpdates(setServerData);
+        const u1 = await listen<any>("gpu_update", (event) => gpuBatch.push(event.payload));
+        unlisteners.add(() => { u1(); gpuBatch.cancel(); });
 
         const u2 = await listen("theme_update", (event: any) => {
           const config = event.payload as WidgetThemeConfig;
-          const themeId = config.assignments?.[win.label];
+          const themeId = config.assignments?.[appWindow.label];
           const theme = config.themes.find(t => t.id === themeId) || config.themes.find(t => t.id === "theme-gpu-default");
           setCurrentTheme(theme || null);
         });
-        unlisteners.push(() => u2());
+        unlisteners.add(() => u2());
 
         const u3 = await listen("gpu_clear", () => {
+          gpuBatch.cancel();
           setServerData([]);
         });
-        unlisteners.push(() => u3());
+        unlisteners.add(() => u3());
+
+        const u4 = await listen<string>("gpu_remove", (event) => gpuBatch.remove(event.payload));
+        unlisteners.add(() => u4());
       } catch (e) { console.error("Widget init failed", e); }
     };
     
     load();
 
     return () => {
-      unlisteners.forEach(f => f());
+      unlisteners.dispose();
     };
   }, []);
 
-  if (!currentTheme) return null;
-
-  const getC = (name: string, fallback: string) => {
-    const c = currentTheme.primary_colors.find(p => p.name === name);
-    return c ? hexToRgba(c.value, c.opacity ?? 1.0) : fallback;
-  };
-  const getT = (name: string, fallback: string) => {
-    const c = currentTheme.text_colors?.find(p => p.name === name);
-    return c ? hexToRgba(c.value, c.opacity ?? 1.0) : fallback;
-  };
-
-  const accent = getC("Accent", "#3b82f6");
-  const success = getC("Success", "#10b981");
-  const warning = getC("Warning", "#f59e0b");
-  const danger = getC("Danger", "#ef4444");
-  const mainText = getT("Main Text", "#ffffff");
-  const subText = getT("Sub Text", "#94a3b8");
+  // Theme colors, resolved once per theme change
+  const rootStyle = useMemo((): CSSProperties | null => {
+    if (!currentTheme) return null;
+    const getC = (name: string, fallback: string) => {
+      const c = currentTheme.primary_colors.find(p => p.name === name);
+      return c ? hexToRgba(c.value, c.opacity ?? 1.0) : fallback;
+    };
+    const getT = (name: string, fallback: string) => {
+      const c = currentTheme.text_colors?.find(p => p.name === name);
+      return c ? hexToRgba(c.value, c.opacity ?? 1.0) : fallback;
+    };
+    const mainText = getT("Main Text", "#ffffff");
+    return {
+      color: mainText,
+      "--gpu-accent": getC("Accent", "#3b82f6"),
+      "--gpu-success": getC("Success", "#10b981"),
+      "--gpu-warning": getC("Warning", "#f59e0b"),
+      "--gpu-danger": getC("Danger", "#ef4444"),
+      "--gpu-main-text": mainText,
+      "--gpu-sub-text": getT("Sub Text", "#94a3b8"),
+    } as CSSProperties;
+  }, [currentTheme]);
+
+  if (!rootStyle) return null;
+  const { accent, subText } = gpuColor;
 
   return (
-    <div className="h-full flex flex-col" style={{ color: mainText }}>
+    <div className="h-full flex flex-col" style={rootStyle}>
       <div className="flex items-center gap-2 mb-4">
         <Cpu size={16} style={{ color: accent }} />
         <span className="text-xs font-black uppercase tracking-widest" style={{ color: subText }}>GPU Monitor</span>
       </div>
       <div className="flex-1 overflow-y-auto custom-scrollbar pr-2 space-y-6">
-        {serverData.length > 0 ? serverData.map((server: any, idx: number) => {
-          const groups: Record<string, any[]> = {};
-          server.gpu_list.forEach((gpu: any) => {
-            const gid = gpu.job_id || "SYSTEM";
-            if (!groups[gid]) groups[gid] = [];
-            groups[gid].push(gpu);
-          });
-
-          return (
-            <div key={idx} className="space-y-4">
-              <div className="flex items-center justify-between border-l-2 border-white/10 pl-2">
-                <div className="flex flex-col items-start">
-                  <span className="text-[10px] font-black uppercase tracking-tighter" style={{ color: mainText }}>{server.host}</span>
-                  {server.last_update && <span className="text-[7px] opacity-40 font-mono">Last: {server.last_update}</span>}
-                </div>
-                {server.is_online ? (
-                  <span className="text-[7px] font-black uppercase" style={{ color: success }}>Online</span>
-                ) : (
-                  <span className="text-[7px] font-black uppercase" style={{ color: danger }}>Offline</span>
-                )}
-              </div>
-
-              {server.error && <div className="text-[9px] font-medium italic px-2" style={{ color: danger }}>{server.error}</div>}
-
-              <div className="space-y-3 pl-2">
-                {Object.entries(groups).map(([jobId, gpus]) => (
-                  <div key={jobId} className="space-y-1.5">
-                    {jobId !== "SYSTEM" && (
-                      <div className="flex items-center gap-1 text-[8px] font-black uppercase tracking-widest pl-1 group/job" style={{ color: subText }}>
-                        <Activity size={10} style={{ color: accent }} /> JOB: {jobId}
-                        <div className="ml-1 flex items-center">
-                          <CopyButton text={jobId} />
-                        </div>
-                      </div>
-                    )}
-                    <div className="grid grid-cols-4 gap-1.5">
-                      {gpus.map((gpu, i) => {
-                        const usage = gpu.util / 100;
-                        const usageColor = usage > 0.9 ? danger : (usage > 0.6 ? warning : accent);
-                        return (
-                          <div key={i} className="space-y-1 bg-white/5 p-1.5 rounded-lg border border-white/5 flex flex-col justify-center min-w-0">
-                            <div className="flex justify-between items-center text-[8px] font-black tracking-tighter">
-                              <span style={{ color: subText }}>#{i}</span>
-                              <span style={{ color: usageColor }}>{gpu.util}%</span>
-                            </div>
-                            <div className="h-1 w-full bg-black/40 rounded-full overflow-hidden">
-                              <motion.div initial={{ width: 0 }} animate={{ width: `${gpu.util}%` }} className="h-full rounded-full" style={{ backgroundColor: usageColor }} />
-                            </div>
-                            <div className="flex justify-between items-center text-[7px] font-bold tracking-tighter tabular-nums" style={{ color: subText }}>
-                              <span>{(gpu.mem_used / 1024).toFixed(0)}G</span>
-                              <span>{(gpu.power || 0).toFixed(0)}W</span>
-                            </div>
-                          </div>
-                        );
-                      })}
-                    </div>
-                  </div>
-                ))}
-              </div>
-            </div>
-          );
-        }) : (
+        {serverData.length > 0 ? serverData.map((server: any) => (
+          <GpuServerBlock key={server.host} server={server} />
+        )) : (
           <div className="text-xs italic text-center mt-4" style={{ color: subText }}>Waiting for backend...</div>
         )}
       </div>
@@ -1002,7 +1209,6 @@ function ArxivWidgetContent() {
   const [arxivConfig, setArxivConfig] = useState<any>({});
   const [currentIndex, setCurrentIndex] = useState(0);
   const [currentTheme, setCurrentTheme] = useState<WidgetTheme | null>(null);
-  const win = getCurrentWindow();
 
   useEffect(() => {
     const load = async () => {
@@ -1010,7 +1216,7 @@ function ArxivWidgetContent() {
         setPapers(await invoke("get_arxiv_papers"));
         setArxivConfig(await invoke("get_arxiv_config"));
         const config: WidgetThemeConfig = await invoke("get_theme_config");
-        const themeId = config.assignments?.[win.label];
+        const themeId = config.assignments?.[appWindow.label];
         const theme = config.themes.find(t => t.id === themeId) || config.themes.find(t => t.id === "theme-arxiv-default");
         setCurrentTheme(theme || null);
       } catch (e) {
@@ -1023,7 +1229,7 @@ function ArxivWidgetContent() {
     const u1 = listen<any[]>("arxiv_update", (event) => setPapers(event.payload));
     const u2 = listen("theme_update", (event: any) => {
       const config = event.payload as WidgetThemeConfig;
-      const themeId = config.assignments?.[win.label];
+      const themeId = config.assignments?.[appWindow.label];
       const theme = config.themes.find(t => t.id === themeId) || config.themes.find(t => t.id === "theme-arxiv-default");
       setCurrentTheme(theme || null);
     });
@@ -1142,7 +1348,6 @@ function DeadlineWidgetContent() {
   const [deadlines, setDeadlines] = useState<any[]>([]);
   const [paperConfig, setPaperConfig] = useState<any>({});
   const [currentTheme, setCurrentTheme] = useState<WidgetTheme | null>(null);
-  const win = getCurrentWindow();
 
   useEffect(() => {
     const fetchConfig = async () => {
@@ -1150,7 +1355,7 @@ function DeadlineWidgetContent() {
         setPaperConfig(await invoke("get_paper_config"));
         setDeadlines(await invoke("get_deadlines"));
         const config: WidgetThemeConfig = await invoke("get_theme_config");
-        const themeId = config.assignments?.[win.label];
+        const themeId = config.assignments?.[appWindow.label];
         const theme = config.themes.find(t => t.id === themeId) || config.themes.find(t => t.id === "theme-deadline-default");
         setCurrentTheme(theme || null);
       } catch (e) {
@@ -1164,7 +1369,7 @@ function DeadlineWidgetContent() {
     const unlistenConfig = listen<any>("paper_config_update", (event) => setPaperConfig(event.payload));
     const unlistenTheme = listen("theme_update", (event: any) => {
       const config = event.payload as WidgetThemeConfig;
-      const themeId = config.assignments?.[win.label];
+      const themeId = config.assignments?.[appWindow.label];
       const theme = config.themes.find(t => t.id === themeId) || config.themes.find(t => t.id === "theme-deadline-default");
       setCurrentTheme(theme || null);
     });
@@ -1176,6 +1381,14 @@ function DeadlineWidgetContent() {
     };
   }, []);
 
+  // Pinned conferences, or just the soonest deadline when nothing is pinned. Recomputed
+  // when the list or the pins change, not on every theme/config render.
+  const displayList = useMemo(() => {
+    const pinned = new Set<string>(paperConfig.pinned_titles || []);
+    const pinnedList = pinned.size > 0 ? deadlines.filter(d => pinned.has(d.title)) : [];
+    return pinnedList.length > 0 ? pinnedList : deadlines.slice(0, 1);
+  }, [deadlines, paperConfig.pinned_titles]);
+
   if (!currentTheme) return null;
 
   const getC = (name: string, fallback: string) => {
@@ -1192,10 +1405,6 @@ function DeadlineWidgetContent() {
   const mainText = getT("Main Text", "#ffffff");
   const subText = getT("Sub Text", "#64748b");
 
-  const pinnedTitles = paperConfig.pinned_titles || [];
-  const pinnedList = deadlines.filter(d => pinnedTitles.includes(d.title));
-  const displayList = pinnedList.length > 0 ? pinnedList : (deadlines.length > 0 ? [deadlines[0]] : []);
-
   return (
     <div className="h-full flex flex-col" style={{ color: mainText }}>
       <div className="flex items-center gap-2 mb-4">
@@ -1326,6 +1535,23 @@ function SettingsPanel({ gpuConfig, paperConfig, arxivConfig, appConfig, themeCo
     setLocalArxiv(arxivConfig);
   }, [arxivConfig]);
 
+  // Filter chips get clicked in quick succession and the count slider fires on every
+  // step; update the panel at once but write and refilter once the input settles
+  const schedulePaperSave = useDebouncedSave<any>(onSavePaper, 400);
+  const savePaper = (next: any) => {
+    setLocalPaper(next);
+    schedulePaperSave(next);
+  };
+
+  // Membership sets for highlighting the chips, rebuilt only when a filter list changes
+  const rankSet = useMemo(() => new Set<string>(localPaper.filter_by_rank || []), [localPaper.filter_by_rank]);
+  const subSet = useMemo(() => new Set<string>(localPaper.filter_by_sub || []), [localPaper.filter_by_sub]);
+
+  // Each control passes only the field it changes
+  const updatePaper = (changes: any) => savePaper({ ...localPaper, ...changes });
+  const toggleIn = (list: string[] | undefined, value: string) =>
+    list?.includes(value) ? list.filter(i => i !== value) : [...(list || []), value];
+
   const addServer = () => {
     const servers = localGpu?.servers || [];
     const next = { ...localGpu, servers: [...servers, { host: "", user: "root", password: "", port: 22 }] };
@@ -1467,14 +1693,8 @@ function SettingsPanel({ gpuConfig, paperConfig, arxivConfig, appConfig, themeCo
                   {["A", "B", "C", "N"].map(r => (
                     <button
                       key={r}
-                      onClick={() => {
-                        const ranks = localPaper.filter_by_rank || [];
-                        const next = ranks.includes(r) ? ranks.filter((i: string) => i !== r) : [...ranks, r];
-                        const nextConfig = { ...localPaper, filter_by_rank: next };
-                        setLocalPaper(nextConfig);
-                        onSavePaper(nextConfig);
-                      }}
-                      className={`px-4 py-2 rounded-lg text-sm font-bold transition-all ${localPaper.filter_by_rank?.includes(r) ? "bg-purple-500 text-white shadow-lg shadow-purple-500/20" : (appConfig.theme === "light" ? "bg-slate-100 text-slate-500 border border-slate-200" : "bg-black/40 text-slate-500 border border-white/5 hover:border-white/20")}`}
+                      onClick={() => updatePaper({ filter_by_rank: toggleIn(localPaper.filter_by_rank, r) })}
+                      className={`px-4 py-2 rounded-lg text-sm font-bold transition-all ${rankSet.has(r) ? "bg-purple-500 text-white shadow-lg shadow-purple-500/20" : (appConfig.theme === "light" ? "bg-slate-100 text-slate-500 border border-slate-200" : "bg-black/40 text-slate-500 border border-white/5 hover:border-white/20")}`}
                     >Rank {r}</button>
                   ))}
                 </div>
@@ -1486,14 +1706,8 @@ function SettingsPanel({ gpuConfig, paperConfig, arxivConfig, appConfig, themeCo
                   {["AI", "CV", "NLP", "HCI", "DM", "Graphics", "Security", "Network", "Systems"].map(cat => (
                     <button
                       key={cat}
-                      onClick={() => {
-                        const subs = localPaper.filter_by_sub || [];
-                        const next = subs.includes(cat) ? subs.filter((i: string) => i !== cat) : [...subs, cat];
-                        const nextConfig = { ...localPaper, filter_by_sub: next };
-                        setLocalPaper(nextConfig);
-                        onSavePaper(nextConfig);
-                      }}
-                      className={`px-4 py-1.5 rounded-lg text-xs font-black transition-all ${localPaper.filter_by_sub?.includes(cat) ? "bg-blue-600 text-white shadow-lg shadow-blue-600/20" : (appConfig.theme === "light" ? "bg-slate-100 text-slate-500 border border-slate-200" : "bg-black/40 text-slate-500 border border-white/5 hover:border-white/20")}`}
+                      onClick={() => updatePaper({ filter_by_sub: toggleIn(localPaper.filter_by_sub, cat) })}
+                      className={`px-4 py-1.5 rounded-lg text-xs font-black transition-all ${subSet.has(cat) ? "bg-blue-600 text-white shadow-lg shadow-blue-600/20" : (appConfig.theme === "light" ? "bg-slate-100 text-slate-500 border border-slate-200" : "bg-black/40 text-slate-500 border border-white/5 hover:border-white/20")}`}
                     >{cat}</button>
                   ))}
                 </div>
@@ -1505,11 +1719,7 @@ function SettingsPanel({ gpuConfig, paperConfig, arxivConfig, appConfig, themeCo
                 <label className={`text-sm font-bold ${appConfig.theme === "light" ? "text-slate-600" : "text-slate-300"}`}>Display Options</label>
                 <div className="flex items-center gap-4">
                   <button
-                    onClick={() => {
-                      const nextConfig = { ...localPaper, show_past_deadlines: !localPaper.show_past_deadlines };
-                      setLocalPaper(nextConfig);
-                      onSavePaper(nextConfig);
-                    }}
+                    onClick={() => updatePaper({ show_past_deadlines: !localPaper.show_past_deadlines })}
                     className={`px-4 py-2 rounded-lg text-sm font-bold transition-all ${localPaper.show_past_deadlines ? "bg-emerald-500 text-white shadow-lg shadow-emerald-500/20" : "bg-black/40 text-slate-500 border border-white/5"}`}
                   >Show Past Events</button>
                 </div>
@@ -1526,12 +1736,7 @@ function SettingsPanel({ gpuConfig, paperConfig, arxivConfig, appConfig, themeCo
                   max="100"
                   step="5"
                   value={localPaper.max_deadlines || 5}
-                  onChange={(e) => {
-                    const next = parseInt(e.target.value);
-                    const nextConfig = { ...localPaper, max_deadlines: next };
-                    setLocalPaper(nextConfig);
-                    onSavePaper(nextConfig);
-                  }}
+                  onChange={(e) => updatePaper({ max_deadlines: parseInt(e.target.value) })}
                   className="w-full h-1.5 bg-blue-600/20 rounded-lg appearance-none cursor-pointer accent-blue-600"
                 />
                 <p className="text-[10px] text-slate-500 font-medium">Control how many upcoming conferences are shown.</p>
@@ -1664,9 +1869,12 @@ function ThemeManagementSection({ themeConfig, onSaveThemes, dashboardTheme, act
   const themes = localThemes.themes || [];
   const editingTheme = themes.find(t => t.id === editingThemeId);
 
+  // Colour pickers and the opacity slider fire on every drag step; keep the editor live
+  // but write the file and broadcast to the widgets once the input settles
+  const scheduleSave = useDebouncedSave<WidgetThemeConfig>(onSaveThemes, 250);
   const save = (next: WidgetThemeConfig) => {
     setLocalThemes(next);
-    onSaveThemes(next);
+    scheduleSave(next);
   };
 
   const addTheme = () => {